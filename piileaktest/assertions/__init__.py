@@ -4,10 +4,12 @@ from piileaktest.assertions.no_pii_assertion import assert_no_forbidden_pii
 from piileaktest.assertions.masking_assertion import assert_masking_applied
 from piileaktest.assertions.allowed_pii_assertion import assert_only_allowed_pii
 from piileaktest.assertions.leakage_path_assertion import assert_no_pii_leakage
+from piileaktest.assertions._scan import scan_dataframe
 
 __all__ = [
     "assert_no_forbidden_pii",
     "assert_masking_applied",
     "assert_only_allowed_pii",
     "assert_no_pii_leakage",
+    "scan_dataframe",
 ]
@@ -0,0 +1,132 @@
+"""Shared column-scan helpers for the assertion functions."""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Any, Callable, Dict, List, Tuple
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from piileaktest.detectors import classify
+from piileaktest.models import PIIType, MaskingType
+
+# Minimum number of cells before forking worker processes pays for itself.
+_PARALLEL_MIN_CELLS = 100_000
+
+# Rows per slice when computing the candidate mask; keeps the arrow string
+# buffers of very large columns within cache instead of materializing the
+# whole column at once.
+_PREFILTER_CHUNK_ROWS = 1 << 16
+
+# Characters at least one of which every value pattern (and the Luhn check)
+# requires: a digit, an email "@", or a mask character. Values without any of
+# these cannot match, so whole cells are rejected in one vectorized pass
+# instead of one Python-level detector call each. The mask is computed by
+# pyarrow's compiled regex kernel, which runs over the contiguous string
+# buffer rather than per-cell Python objects.
+_CANDIDATE_REGEX = r"[0-9@*Xx]"
+
+
+def candidate_cells(series: pd.Series, prefilter: bool = True) -> pd.Series:
+    """
+    Return the non-null cells of a column as stripped, non-empty strings.
+
+    The null-drop, str conversion, whitespace strip and empty-drop all run
+    as vectorized pandas ops, so the per-cell detector loops never pay for
+    them cell by cell.
+
+    Args:
+        series: Column to prepare
+        prefilter: When True, drop cells that cannot possibly match any
+            PII pattern before the per-value detectors run. Callers that
+            also need the entropy detector (which accepts plain-alpha
+            tokens) must pass False.
+
+    Returns:
+        Series of string cells indexed by the original row labels
+    """
+    cells = series.dropna().astype(str).str.strip()
+    cells = cells[cells != ""]
+    if prefilter and len(cells):
+        # Compute the mask in bounded slices so the working set stays
+        # cache-sized however large the column is
+        masks = []
+        values = cells.to_numpy()
+        for start in range(0, len(values), _PREFILTER_CHUNK_ROWS):
+            arr = pa.array(values[start : start + _PREFILTER_CHUNK_ROWS], type=pa.string())
+            mask = pc.match_substring_regex(arr, _CANDIDATE_REGEX)
+            masks.append(mask.to_numpy(zero_copy_only=False))
+        cells = cells[masks[0] if len(masks) == 1 else np.concatenate(masks)]
+    return cells
+
+
+def map_columns(
+    df: pd.DataFrame, scan_one: Callable, *args: Any
+) -> List[Tuple[str, Any]]:
+    """
+    Apply ``scan_one(col_name, series, *args)`` to every column.
+
+    The column scans are embarrassingly parallel, so large frames are
+    partitioned across a process pool (one column per task); small frames
+    stay serial because the fork/pickle overhead would dominate.
+
+    Args:
+        df: DataFrame whose columns to scan
+        scan_one: Module-level (picklable) per-column scan function
+        *args: Extra arguments passed to every scan call
+
+    Returns:
+        List of (column_name, scan_result) pairs in column order
+    """
+    cols = list(df.columns)
+    if (
+        len(cols) < 2
+        or len(df) * len(cols) < _PARALLEL_MIN_CELLS
+        or (os.cpu_count() or 1) < 2
+    ):
+        return [(col, scan_one(col, df[col], *args)) for col in cols]
+
+    with ProcessPoolExecutor() as executor:
+        results = executor.map(
+            scan_one, cols, (df[col] for col in cols), *(repeat(a) for a in args)
+        )
+        return list(zip(cols, results))
+
+
+def _scan_cells(
+    col: str, series: pd.Series
+) -> List[Tuple[Any, str, PIIType, MaskingType]]:
+    """Run every detector over one column, recording all hits."""
+    hits: List[Tuple[Any, str, PIIType, MaskingType]] = []
+    _classify = classify
+
+    # Every detector is on (including entropy), so no candidate prefilter
+    cells = candidate_cells(series, prefilter=False)
+    for idx, value_str in zip(cells.index.to_numpy(), cells.to_numpy()):
+        for pii_type, masking_type in _classify(value_str):
+            hits.append((idx, value_str, pii_type, masking_type))
+
+    return hits
+
+
+def scan_dataframe(
+    df: pd.DataFrame,
+) -> Dict[str, List[Tuple[Any, str, PIIType, MaskingType]]]:
+    """
+    Scan every cell of a DataFrame once with the full detector set.
+
+    The per-dataset assertions each accept the result via their ``scan``
+    parameter, so a caller running several assertions against the same
+    frame (the usual suite workflow) pays for a single pass instead of
+    one pass per assertion.
+
+    Args:
+        df: DataFrame to scan
+
+    Returns:
+        Mapping of column name to (row_label, value, PIIType, MaskingType)
+        tuples for every detector hit in that column
+    """
+    return dict(map_columns(df, _scan_cells))
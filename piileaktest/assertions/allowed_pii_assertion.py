@@ -1,7 +1,7 @@
 """Assertion: Only allowed PII types should be present."""
 
 import pandas as pd
-from typing import List, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 from piileaktest.models import (
     AssertionResult,
     Finding,
@@ -10,16 +10,66 @@ from piileaktest.models import (
     DatasetPolicy,
     MaskingType,
 )
-from piileaktest.detectors import detect_pii_in_value, is_credit_card
-from piileaktest.detectors.luhn import detect_credit_card_masking
-from piileaktest.detectors.entropy import is_high_entropy_token
+from piileaktest.detectors import classify
 from piileaktest.utils.redaction import redact_value
+from piileaktest.assertions._scan import candidate_cells, map_columns
+
+
+def _scan_column(
+    col: str,
+    series: pd.Series,
+    allowed_types: Set[PIIType],
+) -> Tuple[Dict[PIIType, int], Dict[PIIType, Tuple]]:
+    """Scan one column, returning disallowed-PII counts and first samples."""
+    col_counts: Dict[PIIType, int] = {}
+    col_first: Dict[PIIType, Tuple] = {}
+
+    # Local bindings save a global/attribute lookup per cell in the hot loop
+    _classify = classify
+
+    # The entropy detector accepts plain-alpha tokens, so every non-null
+    # cell must be examined (no candidate prefilter).
+    cells = candidate_cells(series, prefilter=False)
+    # zip over raw numpy arrays is cheaper per iteration than Series.items()
+    for idx, value_str in zip(cells.index.to_numpy(), cells.to_numpy()):
+        # One fused pass over every detector (strict check: all types)
+        for pii_type, masking_type in _classify(value_str):
+            if pii_type not in allowed_types:
+                if pii_type not in col_counts:
+                    col_counts[pii_type] = 1
+                    col_first[pii_type] = (idx, value_str, masking_type)
+                else:
+                    col_counts[pii_type] += 1
+
+    return col_counts, col_first
+
+
+
+def _tally(
+    entries: List[Tuple[Any, str, PIIType, MaskingType]],
+    allowed_types: Set[PIIType],
+) -> Tuple[Dict[PIIType, int], Dict[PIIType, Tuple]]:
+    """Fold precomputed scan hits into per-type counts and first samples."""
+    col_counts: Dict[PIIType, int] = {}
+    col_first: Dict[PIIType, Tuple] = {}
+
+    for idx, value_str, pii_type, masking_type in entries:
+        if pii_type in allowed_types:
+            continue
+        if pii_type not in col_counts:
+            col_counts[pii_type] = 1
+            col_first[pii_type] = (idx, value_str, masking_type)
+        else:
+            col_counts[pii_type] += 1
+
+    return col_counts, col_first
 
 
 def assert_only_allowed_pii(
     df: pd.DataFrame,
     policy: DatasetPolicy,
     max_violations: int = 10,
+    scan: Optional[Dict[str, List[Tuple]]] = None,
 ) -> AssertionResult:
     """
     Assert that only explicitly allowed PII types appear in the dataset.
@@ -29,75 +79,47 @@ def assert_only_allowed_pii(
     Args:
         df: DataFrame to check
         policy: Dataset policy with allowed_pii_types
-        max_violations: Maximum number of violation examples to collect
+        max_violations: Kept for API compatibility; each finding records
+            the first example plus a total occurrence count
+        scan: Optional precomputed result of
+            :func:`piileaktest.assertions._scan.scan_dataframe` for this
+            frame; when given, the DataFrame is not re-scanned
 
     Returns:
         AssertionResult with findings
     """
     findings: List[Finding] = []
+    total_violations = 0
+    unique_types: Set[PIIType] = set()
     allowed_types = set(policy.allowed_pii_types)
 
-    # Scan each column
-    for col in df.columns:
-        col_findings = {}  # Track findings by PII type
-
-        for idx, value in df[col].items():
-            if pd.isna(value):
-                continue
-
-            value_str = str(value).strip()
-            if not value_str:
-                continue
-
-            # Collect all detected PII types
-            detected_types: Set[PIIType] = set()
-
-            # Check standard patterns
-            detected = detect_pii_in_value(value_str)
-            for pii_type, masking_type in detected:
-                if pii_type not in allowed_types:
-                    detected_types.add(pii_type)
-                    if pii_type not in col_findings:
-                        col_findings[pii_type] = []
-                    if len(col_findings[pii_type]) < max_violations:
-                        col_findings[pii_type].append((idx, value_str, masking_type))
-
-            # Check credit card separately (Luhn)
-            if is_credit_card(value_str):
-                if PIIType.CREDIT_CARD not in allowed_types:
-                    masking_type = detect_credit_card_masking(value_str)
-                    if PIIType.CREDIT_CARD not in col_findings:
-                        col_findings[PIIType.CREDIT_CARD] = []
-                    if len(col_findings[PIIType.CREDIT_CARD]) < max_violations:
-                        col_findings[PIIType.CREDIT_CARD].append((idx, value_str, masking_type))
-
-            # Check high entropy tokens
-            if is_high_entropy_token(value_str):
-                if PIIType.HIGH_ENTROPY_TOKEN not in allowed_types:
-                    if PIIType.HIGH_ENTROPY_TOKEN not in col_findings:
-                        col_findings[PIIType.HIGH_ENTROPY_TOKEN] = []
-                    if len(col_findings[PIIType.HIGH_ENTROPY_TOKEN]) < max_violations:
-                        col_findings[PIIType.HIGH_ENTROPY_TOKEN].append(
-                            (idx, value_str, MaskingType.PLAINTEXT)
-                        )
+    # Scan columns (partitioned across worker processes for large frames)
+    if scan is not None:
+        col_results = [
+            (col, _tally(entries, allowed_types)) for col, entries in scan.items()
+        ]
+    else:
+        col_results = map_columns(df, _scan_column, allowed_types)
 
+    for col, (col_counts, col_first) in col_results:
         # Convert to Finding objects
-        for pii_type, violations in col_findings.items():
-            if violations:
-                first_violation = violations[0]
-                finding = Finding(
-                    dataset=policy.name,
-                    column=col,
-                    pii_type=pii_type,
-                    masking_type=first_violation[2],
-                    row_index=int(first_violation[0]),
-                    redacted_sample=redact_value(first_violation[1], pii_type.value),
-                    count=len(violations),
-                    severity=Severity.HIGH,
-                    message=f"Disallowed PII type '{pii_type.value}' found in column '{col}' "
-                    f"({len(violations)} occurrence(s))",
-                )
-                findings.append(finding)
+        for pii_type, count in col_counts.items():
+            first_violation = col_first[pii_type]
+            finding = Finding(
+                dataset=policy.name,
+                column=col,
+                pii_type=pii_type,
+                masking_type=first_violation[2],
+                row_index=int(first_violation[0]),
+                redacted_sample=redact_value(first_violation[1], pii_type.value),
+                count=count,
+                severity=Severity.HIGH,
+                message=f"Disallowed PII type '{pii_type.value}' found in column '{col}' "
+                f"({count} occurrence(s))",
+            )
+            findings.append(finding)
+            total_violations += count
+            unique_types.add(pii_type)
 
     passed = len(findings) == 0
     severity = Severity.HIGH if not passed else Severity.INFO
@@ -105,10 +127,8 @@ def assert_only_allowed_pii(
     if passed:
         message = f"PASS: Only allowed PII types present in {policy.name}"
     else:
-        total_violations = sum(f.count for f in findings)
-        unique_types = len(set(f.pii_type for f in findings))
         message = (
-            f"FAIL: {policy.name} contains {unique_types} disallowed PII type(s) "
+            f"FAIL: {policy.name} contains {len(unique_types)} disallowed PII type(s) "
             f"with {total_violations} total occurrence(s)"
         )
 
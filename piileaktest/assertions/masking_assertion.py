@@ -1,7 +1,7 @@
 """Assertion: Verify masking/hashing is properly applied to PII."""
 
 import pandas as pd
-from typing import List
+from typing import Any, Dict, List, Optional, Set, Tuple
 from piileaktest.models import (
     AssertionResult,
     Finding,
@@ -10,15 +10,93 @@ from piileaktest.models import (
     DatasetPolicy,
     MaskingType,
 )
-from piileaktest.detectors import detect_pii_in_value, is_credit_card
-from piileaktest.detectors.luhn import detect_credit_card_masking
+from piileaktest.detectors import classify
 from piileaktest.utils.redaction import redact_value
+from piileaktest.assertions._scan import candidate_cells, map_columns
+
+
+def _scan_column(
+    col: str,
+    series: pd.Series,
+    masking_required: Set[PIIType],
+    hash_allowed: Set[PIIType],
+) -> Tuple[Dict[PIIType, int], Dict[PIIType, Tuple]]:
+    """Scan one column, returning masking-violation counts and first samples."""
+    col_counts: Dict[PIIType, int] = {}
+    col_first: Dict[PIIType, Tuple] = {}
+
+    # Local bindings save a global/attribute lookup per cell in the hot loop
+    _classify = classify
+    _PLAINTEXT = MaskingType.PLAINTEXT
+    _HASH = MaskingType.HASH
+
+    cells = candidate_cells(series)
+    # zip over raw numpy arrays is cheaper per iteration than Series.items()
+    for idx, value_str in zip(cells.index.to_numpy(), cells.to_numpy()):
+        # One fused pass restricted to the types requiring masking (this
+        # assertion never looks at entropy tokens, so that detector is off)
+        for pii_type, masking_type in _classify(
+            value_str, need_entropy=False, types=masking_required
+        ):
+            # Check if masking is acceptable
+            is_violation = False
+
+            if masking_type == _PLAINTEXT:
+                # Plaintext is never acceptable for masking_required
+                is_violation = True
+            elif masking_type == _HASH:
+                # Hash is only acceptable if explicitly allowed
+                if pii_type not in hash_allowed:
+                    is_violation = True
+            # PARTIAL_MASK, FULL_MASK, TOKENIZED are acceptable
+
+            if is_violation:
+                if pii_type not in col_counts:
+                    col_counts[pii_type] = 1
+                    col_first[pii_type] = (idx, value_str, masking_type)
+                else:
+                    col_counts[pii_type] += 1
+
+    return col_counts, col_first
+
+
+
+def _tally(
+    entries: List[Tuple[Any, str, PIIType, MaskingType]],
+    masking_required: Set[PIIType],
+    hash_allowed: Set[PIIType],
+) -> Tuple[Dict[PIIType, int], Dict[PIIType, Tuple]]:
+    """Fold precomputed scan hits into per-type counts and first samples."""
+    col_counts: Dict[PIIType, int] = {}
+    col_first: Dict[PIIType, Tuple] = {}
+
+    for idx, value_str, pii_type, masking_type in entries:
+        # The full scan includes the entropy detector, which this
+        # assertion never consults
+        if pii_type not in masking_required or pii_type == PIIType.HIGH_ENTROPY_TOKEN:
+            continue
+        if masking_type == MaskingType.PLAINTEXT:
+            is_violation = True
+        elif masking_type == MaskingType.HASH:
+            is_violation = pii_type not in hash_allowed
+        else:
+            is_violation = False
+        if not is_violation:
+            continue
+        if pii_type not in col_counts:
+            col_counts[pii_type] = 1
+            col_first[pii_type] = (idx, value_str, masking_type)
+        else:
+            col_counts[pii_type] += 1
+
+    return col_counts, col_first
 
 
 def assert_masking_applied(
     df: pd.DataFrame,
     policy: DatasetPolicy,
     max_violations: int = 10,
+    scan: Optional[Dict[str, List[Tuple]]] = None,
 ) -> AssertionResult:
     """
     Assert that required masking/hashing is properly applied to PII.
@@ -26,7 +104,11 @@ def assert_masking_applied(
     Args:
         df: DataFrame to check
         policy: Dataset policy with masking_required_for and hash_allowed_for
-        max_violations: Maximum number of violation examples to collect
+        max_violations: Kept for API compatibility; each finding records
+            the first example plus a total occurrence count
+        scan: Optional precomputed result of
+            :func:`piileaktest.assertions._scan.scan_dataframe` for this
+            frame; when given, the DataFrame is not re-scanned
 
     Returns:
         AssertionResult with findings
@@ -44,86 +126,44 @@ def assert_masking_applied(
             severity=Severity.INFO,
         )
 
-    # Scan each column
-    for col in df.columns:
-        col_findings = {}  # Track findings by PII type
-
-        for idx, value in df[col].items():
-            if pd.isna(value):
-                continue
-
-            value_str = str(value).strip()
-            if not value_str:
-                continue
-
-            # Check standard patterns
-            detected = detect_pii_in_value(value_str)
-            for pii_type, masking_type in detected:
-                if pii_type in masking_required:
-                    # Check if masking is acceptable
-                    is_violation = False
-
-                    if masking_type == MaskingType.PLAINTEXT:
-                        # Plaintext is never acceptable for masking_required
-                        is_violation = True
-                    elif masking_type == MaskingType.HASH:
-                        # Hash is only acceptable if explicitly allowed
-                        if pii_type not in hash_allowed:
-                            is_violation = True
-                    # PARTIAL_MASK, FULL_MASK, TOKENIZED are acceptable
-
-                    if is_violation:
-                        if pii_type not in col_findings:
-                            col_findings[pii_type] = []
-                        if len(col_findings[pii_type]) < max_violations:
-                            col_findings[pii_type].append((idx, value_str, masking_type))
-
-            # Check credit card separately (Luhn)
-            if PIIType.CREDIT_CARD in masking_required and is_credit_card(value_str):
-                masking_type = detect_credit_card_masking(value_str)
-
-                is_violation = False
-                if masking_type == MaskingType.PLAINTEXT:
-                    is_violation = True
-                elif masking_type == MaskingType.HASH:
-                    if PIIType.CREDIT_CARD not in hash_allowed:
-                        is_violation = True
-
-                if is_violation:
-                    if PIIType.CREDIT_CARD not in col_findings:
-                        col_findings[PIIType.CREDIT_CARD] = []
-                    if len(col_findings[PIIType.CREDIT_CARD]) < max_violations:
-                        col_findings[PIIType.CREDIT_CARD].append((idx, value_str, masking_type))
+    if scan is not None:
+        col_results = [
+            (col, _tally(entries, masking_required, hash_allowed))
+            for col, entries in scan.items()
+        ]
+    else:
+        # Scan columns (partitioned across worker processes for large frames)
+        col_results = map_columns(df, _scan_column, masking_required, hash_allowed)
 
+    for col, (col_counts, col_first) in col_results:
         # Convert to Finding objects
-        for pii_type, violations in col_findings.items():
-            if violations:
-                first_violation = violations[0]
-
-                # Determine severity based on masking type
-                if first_violation[2] == MaskingType.PLAINTEXT:
-                    severity = Severity.CRITICAL
-                    msg_detail = "not masked (plaintext detected)"
-                elif first_violation[2] == MaskingType.HASH:
-                    severity = Severity.HIGH
-                    msg_detail = "hashed but hashing not allowed by policy"
-                else:
-                    severity = Severity.MEDIUM
-                    msg_detail = "masking insufficient"
-
-                finding = Finding(
-                    dataset=policy.name,
-                    column=col,
-                    pii_type=pii_type,
-                    masking_type=first_violation[2],
-                    row_index=int(first_violation[0]),
-                    redacted_sample=redact_value(first_violation[1], pii_type.value),
-                    count=len(violations),
-                    severity=severity,
-                    message=f"Required masking not applied to '{pii_type.value}' in column '{col}' "
-                    f"({len(violations)} occurrence(s)): {msg_detail}",
-                )
-                findings.append(finding)
+        for pii_type, count in col_counts.items():
+            first_violation = col_first[pii_type]
+
+            # Determine severity based on masking type
+            if first_violation[2] == MaskingType.PLAINTEXT:
+                severity = Severity.CRITICAL
+                msg_detail = "not masked (plaintext detected)"
+            elif first_violation[2] == MaskingType.HASH:
+                severity = Severity.HIGH
+                msg_detail = "hashed but hashing not allowed by policy"
+            else:
+                severity = Severity.MEDIUM
+                msg_detail = "masking insufficient"
+
+            finding = Finding(
+                dataset=policy.name,
+                column=col,
+                pii_type=pii_type,
+                masking_type=first_violation[2],
+                row_index=int(first_violation[0]),
+                redacted_sample=redact_value(first_violation[1], pii_type.value),
+                count=count,
+                severity=severity,
+                message=f"Required masking not applied to '{pii_type.value}' in column '{col}' "
+                f"({count} occurrence(s)): {msg_detail}",
+            )
+            findings.append(finding)
 
     passed = len(findings) == 0
     max_severity = max([f.severity for f in findings], default=Severity.INFO)
@@ -2,6 +2,7 @@
 
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 import typer
@@ -14,6 +15,7 @@ from piileaktest.assertions import (
     assert_masking_applied,
     assert_only_allowed_pii,
     assert_no_pii_leakage,
+    scan_dataframe,
 )
 from piileaktest.lineage import (
     get_all_lineage_edges,
@@ -31,8 +33,17 @@ app = typer.Typer(
 logger = setup_logger("piileaktest.cli")
 
 
-def load_dataframe(file_path: str, format_hint: Optional[str] = None) -> pd.DataFrame:
-    """Load a DataFrame from file with format auto-detection."""
+def load_dataframe(
+    file_path: str, format_hint: Optional[str] = None, limit: Optional[int] = None
+) -> pd.DataFrame:
+    """
+    Load a DataFrame from file with format auto-detection.
+
+    CSV and Parquet go through pyarrow's parallel readers. When ``limit``
+    is given (head sampling), both formats read incrementally and stop
+    as soon as enough rows are in, instead of materializing the whole
+    file just to discard most of it.
+    """
     path = Path(file_path)
 
     if not path.exists():
@@ -45,19 +56,93 @@ def load_dataframe(file_path: str, format_hint: Optional[str] = None) -> pd.Data
         fmt = path.suffix.lower().lstrip(".")
 
     if fmt in ["csv", "txt"]:
-        return pd.read_csv(file_path)
-    elif fmt == "json":
-        return pd.read_json(file_path)
+        return _read_csv_arrow(file_path, limit)
+    elif fmt in ["json", "jsonl", "ndjson"]:
+        return _read_json(file_path, fmt)
     elif fmt in ["parquet", "pq"]:
-        return pd.read_parquet(file_path)
+        return _read_parquet_arrow(file_path, limit)
     else:
         # Try CSV as fallback
         try:
-            return pd.read_csv(file_path)
+            return _read_csv_arrow(file_path, limit)
         except Exception:
             raise ValueError(f"Unsupported file format: {fmt}")
 
 
+def _read_json(file_path: str, fmt: str) -> pd.DataFrame:
+    """
+    Read JSON, streaming JSON Lines through pyarrow's parallel parser.
+
+    Regular JSON (record arrays, column dicts) stays on pd.read_json;
+    pyarrow's reader only understands one record per line but parses
+    those in C++ without buffering the file as one Python string.
+    """
+    if fmt == "json" and not _looks_like_jsonl(file_path):
+        return pd.read_json(file_path)
+
+    import pyarrow.json as pa_json
+
+    return pa_json.read_json(file_path).to_pandas()
+
+
+def _looks_like_jsonl(file_path: str) -> bool:
+    """Detect one-record-per-line JSON from the first two non-empty lines."""
+    import json as _json
+
+    with open(file_path, "rb") as f:
+        head = f.read(1 << 16)
+
+    lines = [line for line in head.splitlines()[:-1] or head.splitlines() if line.strip()]
+    if len(lines) < 2:
+        return False
+    try:
+        return all(isinstance(_json.loads(line), dict) for line in lines[:2])
+    except ValueError:
+        return False
+
+
+def _read_csv_arrow(file_path: str, limit: Optional[int] = None) -> pd.DataFrame:
+    """Read a CSV via pyarrow, stopping early when a row limit is given."""
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+
+    if limit is None:
+        return pa_csv.read_csv(file_path).to_pandas()
+
+    batches = []
+    rows = 0
+    with pa_csv.open_csv(file_path) as reader:
+        for batch in reader:
+            batches.append(batch)
+            rows += batch.num_rows
+            if rows >= limit:
+                break
+    table = pa.Table.from_batches(batches, schema=reader.schema)
+    return table.slice(0, limit).to_pandas()
+
+
+def _read_parquet_arrow(file_path: str, limit: Optional[int] = None) -> pd.DataFrame:
+    """Read a Parquet file via pyarrow, batch-wise when a row limit is given."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    if limit is None:
+        # Memory-map so the kernel pages in only what is touched, and let
+        # to_pandas hand buffers over instead of copying them
+        table = pq.read_table(file_path, memory_map=True, use_threads=True)
+        return table.to_pandas(split_blocks=True, self_destruct=True)
+
+    batches = []
+    rows = 0
+    for batch in pq.ParquetFile(file_path).iter_batches(batch_size=min(limit, 65536)):
+        batches.append(batch)
+        rows += batch.num_rows
+        if rows >= limit:
+            break
+    table = pa.Table.from_batches(batches)
+    return table.slice(0, limit).to_pandas()
+
+
 @app.command()
 def scan(
     file: str = typer.Argument(..., help="Path to data file to scan"),
@@ -77,6 +162,13 @@ def scan(
         None,
         help="File format hint (csv, json, parquet)",
     ),
+    suspect_columns_only: bool = typer.Option(
+        False,
+        "--suspect-columns-only",
+        help="Scan only columns whose names look like PII (faster on wide "
+        "frames, but trusts the column-name heuristics: PII hiding in "
+        "innocuously named columns will be missed)",
+    ),
 ):
     """
     Ad-hoc scan of a single file for PII violations.
@@ -88,6 +180,16 @@ def scan(
         df = load_dataframe(file, format)
         logger.info(f"Loaded {len(df)} rows, {len(df.columns)} columns")
 
+        if suspect_columns_only:
+            from piileaktest.detectors import identify_pii_columns
+
+            suspects = identify_pii_columns(list(df.columns))
+            logger.info(
+                f"Restricting scan to {len(suspects)} suspect column(s) "
+                f"of {len(df.columns)}"
+            )
+            df = df[list(suspects)]
+
         # Parse forbidden PII types
         forbidden_types = []
         if forbidden_pii:
@@ -182,11 +284,20 @@ def run_suite(
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
 
-        # Load all datasets
-        datasets = {}
-        for ds_policy in suite_config.datasets:
+        # Load all datasets concurrently: pandas/pyarrow release the GIL
+        # during IO and decoding, so threads overlap the reads
+        def _load_one(ds_policy: DatasetPolicy) -> pd.DataFrame:
             logger.info(f"Loading dataset: {ds_policy.name}")
-            df = load_dataframe(ds_policy.path, ds_policy.format)
+            df = load_dataframe(
+                ds_policy.path,
+                ds_policy.format,
+                # Head sampling lets the reader stop early
+                limit=(
+                    suite_config.sampling.rows
+                    if suite_config.sampling.mode == "head"
+                    else None
+                ),
+            )
 
             # Apply sampling
             df = sample_dataframe(
@@ -194,8 +305,18 @@ def run_suite(
                 mode=suite_config.sampling.mode,
                 rows=suite_config.sampling.rows,
             )
-            datasets[ds_policy.name] = df
-            logger.info(f"  Loaded {len(df)} rows (after sampling)")
+            logger.info(f"  Loaded {len(df)} rows from {ds_policy.name} (after sampling)")
+            return df
+
+        with ThreadPoolExecutor(
+            max_workers=min(8, len(suite_config.datasets))
+        ) as executor:
+            datasets = dict(
+                zip(
+                    (ds.name for ds in suite_config.datasets),
+                    executor.map(_load_one, suite_config.datasets),
+                )
+            )
 
         # Run assertions
         suite_result = SuiteResult(
@@ -207,6 +328,15 @@ def run_suite(
         for ds_policy in suite_config.datasets:
             df = datasets[ds_policy.name]
 
+            # When more than one assertion applies to this dataset, scan
+            # it once up front and feed the shared result to all of them
+            checks = [
+                bool(ds_policy.forbidden_pii_types),
+                bool(ds_policy.masking_required_for),
+                bool(ds_policy.allowed_pii_types),
+            ]
+            scan = scan_dataframe(df) if sum(checks) > 1 else None
+
             # No forbidden PII assertion
             if ds_policy.forbidden_pii_types:
                 logger.info(f"Checking forbidden PII in {ds_policy.name}")
@@ -214,6 +344,7 @@ def run_suite(
                     df,
                     ds_policy,
                     suite_config.thresholds.max_violations_to_show,
+                    scan=scan,
                 )
                 suite_result.assertion_results.append(result)
 
@@ -224,6 +355,7 @@ def run_suite(
                     df,
                     ds_policy,
                     suite_config.thresholds.max_violations_to_show,
+                    scan=scan,
                 )
                 suite_result.assertion_results.append(result)
 
@@ -234,15 +366,17 @@ def run_suite(
                     df,
                     ds_policy,
                     suite_config.thresholds.max_violations_to_show,
+                    scan=scan,
                 )
                 suite_result.assertion_results.append(result)
 
         # 2. Run lineage assertions
         if suite_config.lineage:
             logger.info("Checking lineage for PII leakage")
+            policies_by_name = {p.name: p for p in suite_config.datasets}
             for edge in suite_config.lineage:
-                source_policy = next(ds for ds in suite_config.datasets if ds.name == edge.source)
-                target_policy = next(ds for ds in suite_config.datasets if ds.name == edge.target)
+                source_policy = policies_by_name[edge.source]
+                target_policy = policies_by_name[edge.target]
 
                 source_df = datasets[edge.source]
                 target_df = datasets[edge.target]
@@ -359,7 +493,16 @@ def validate_flow(
         # Load datasets
         datasets = {}
         for ds_policy in suite_config.datasets:
-            df = load_dataframe(ds_policy.path, ds_policy.format)
+            df = load_dataframe(
+                ds_policy.path,
+                ds_policy.format,
+                # Head sampling lets the reader stop early
+                limit=(
+                    suite_config.sampling.rows
+                    if suite_config.sampling.mode == "head"
+                    else None
+                ),
+            )
             df = sample_dataframe(
                 df,
                 mode=suite_config.sampling.mode,
@@ -369,10 +512,11 @@ def validate_flow(
 
         # Run lineage checks only
         suite_result = SuiteResult(suite_name="Lineage Validation")
+        policies_by_name = {p.name: p for p in suite_config.datasets}
 
         for edge in suite_config.lineage:
-            source_policy = next(ds for ds in suite_config.datasets if ds.name == edge.source)
-            target_policy = next(ds for ds in suite_config.datasets if ds.name == edge.target)
+            source_policy = policies_by_name[edge.source]
+            target_policy = policies_by_name[edge.target]
 
             source_df = datasets[edge.source]
             target_df = datasets[edge.target]
@@ -1,15 +1,32 @@
 """Configuration loader for PIILeakTest."""
 
+import os
+
 import yaml
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
+
 from piileaktest.models import SuiteConfig
 
+try:
+    # libyaml C parser, typically several times faster than the pure-Python
+    # loader on nontrivial configs
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - depends on how pyyaml was built
+    from yaml import SafeLoader as _SafeLoader
+
+# Parsed configs memoized by (path, mtime): repeat CLI invocations against an
+# unchanged file skip the YAML parse and pydantic validation entirely
+_config_cache: Dict[Tuple[str, int], SuiteConfig] = {}
+
 
 def load_suite_config(config_path: str) -> SuiteConfig:
     """
     Load test suite configuration from YAML file.
 
+    The parsed config is cached keyed on the file's path and mtime, so
+    loading the same unchanged file again is a dict lookup.
+
     Args:
         config_path: Path to the YAML configuration file
 
@@ -24,17 +41,25 @@ def load_suite_config(config_path: str) -> SuiteConfig:
     if not path.exists():
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
+    cache_key = (str(path), os.stat(path).st_mtime_ns)
+    cached = _config_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     with open(path, "r") as f:
-        raw_config = yaml.safe_load(f)
+        raw_config = yaml.load(f, Loader=_SafeLoader)
 
     if not raw_config:
         raise ValueError(f"Empty configuration file: {config_path}")
 
     try:
-        return SuiteConfig(**raw_config)
+        config = SuiteConfig(**raw_config)
     except Exception as e:
         raise ValueError(f"Invalid configuration: {e}")
 
+    _config_cache[cache_key] = config
+    return config
+
 
 def load_policy_from_dict(policy_dict: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -1,22 +1,52 @@
 """Detector package for PIILeakTest."""
 
 from piileaktest.detectors.column_heuristics import identify_pii_columns, is_likely_pii_column
-from piileaktest.detectors.value_patterns import detect_pii_in_value, MATCHERS
-from piileaktest.detectors.luhn import is_credit_card, detect_credit_card_masking
+from piileaktest.detectors.value_patterns import (
+    detect_pii_in_value,
+    detect_pii_in_column,
+    MATCHERS,
+    _detect_pii_cached,
+)
+from piileaktest.detectors.luhn import (
+    is_credit_card,
+    detect_credit_card_masking,
+    _masking_cached,
+    credit_card_mask,
+    credit_card_masking_vec,
+)
 from piileaktest.detectors.entropy import (
     is_high_entropy_token,
     calculate_shannon_entropy,
+    shannon_entropy_batch,
     detect_common_token_patterns,
+    token_shape_mask,
 )
+from piileaktest.detectors.fused import classify
+
+
+def clear_caches() -> None:
+    """Clear the per-value detector memoization caches."""
+    _detect_pii_cached.cache_clear()
+    is_credit_card.cache_clear()
+    _masking_cached.cache_clear()
+    is_high_entropy_token.cache_clear()
+
 
 __all__ = [
     "identify_pii_columns",
     "is_likely_pii_column",
     "detect_pii_in_value",
+    "detect_pii_in_column",
+    "classify",
+    "clear_caches",
     "MATCHERS",
     "is_credit_card",
     "detect_credit_card_masking",
+    "credit_card_mask",
+    "credit_card_masking_vec",
     "is_high_entropy_token",
     "calculate_shannon_entropy",
+    "shannon_entropy_batch",
     "detect_common_token_patterns",
+    "token_shape_mask",
 ]
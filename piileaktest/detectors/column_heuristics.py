@@ -1,7 +1,8 @@
 """Column heuristics for detecting PII based on column names."""
 
 import re
-from typing import List, Set
+from functools import lru_cache
+from typing import FrozenSet, List, Set
 from piileaktest.models import PIIType
 
 # Common column name patterns for PII types
@@ -77,6 +78,25 @@ PII_COLUMN_PATTERNS = {
     ],
 }
 
+# All patterns fused into one alternation with a named group per PIIType,
+# so a single regex pass over a column name reports every matching type
+# instead of one re.search call per pattern.
+_COMBINED_PATTERN = re.compile(
+    "|".join(
+        f"(?P<{pii_type.name}>{'|'.join(patterns)})"
+        for pii_type, patterns in PII_COLUMN_PATTERNS.items()
+    )
+)
+
+
+@lru_cache(maxsize=4096)
+def _types_for_column(column_name: str) -> FrozenSet[PIIType]:
+    """Memoized per-name lookup; schemas repeat column names across datasets."""
+    col_lower = column_name.lower().strip()
+    return frozenset(
+        PIIType[match.lastgroup] for match in _COMBINED_PATTERN.finditer(col_lower)
+    )
+
 
 def identify_pii_columns(column_names: List[str]) -> dict[str, Set[PIIType]]:
     """
@@ -91,21 +111,15 @@ def identify_pii_columns(column_names: List[str]) -> dict[str, Set[PIIType]]:
     results = {}
 
     for col in column_names:
-        col_lower = col.lower().strip()
-        potential_types = set()
-
-        for pii_type, patterns in PII_COLUMN_PATTERNS.items():
-            for pattern in patterns:
-                if re.search(pattern, col_lower):
-                    potential_types.add(pii_type)
-                    break
-
+        potential_types = _types_for_column(col)
         if potential_types:
-            results[col] = potential_types
+            # Fresh mutable set per call; the cached frozenset stays shared
+            results[col] = set(potential_types)
 
     return results
 
 
+@lru_cache(maxsize=4096)
 def is_likely_pii_column(column_name: str) -> bool:
     """
     Check if a column name suggests it contains PII.
@@ -116,11 +130,4 @@ def is_likely_pii_column(column_name: str) -> bool:
     Returns:
         True if column name suggests PII content
     """
-    col_lower = column_name.lower().strip()
-
-    for patterns in PII_COLUMN_PATTERNS.values():
-        for pattern in patterns:
-            if re.search(pattern, col_lower):
-                return True
-
-    return False
+    return _COMBINED_PATTERN.search(column_name.lower().strip()) is not None
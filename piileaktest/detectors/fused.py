@@ -0,0 +1,63 @@
+"""Fused single-pass classification combining the per-value detectors."""
+
+from typing import List, Optional, Sequence, Set, Tuple
+
+from piileaktest.models import PIIType, MaskingType
+from piileaktest.detectors.value_patterns import detect_pii_in_value
+from piileaktest.detectors.luhn import is_credit_card, detect_credit_card_masking
+from piileaktest.detectors.entropy import is_high_entropy_token
+
+# The Luhn check only ever accepts 13-19 digit payloads, and the entropy
+# detector only ever accepts tokens of at least 16 chars with no whitespace.
+# Checking those necessary conditions here lets both detectors be skipped
+# for most cells without calling into them at all.
+_CC_MIN_DIGITS = 13
+_CC_MAX_DIGITS = 19
+_ENTROPY_MIN_LEN = 16
+
+
+def classify(
+    value: str,
+    need_credit_card: bool = True,
+    need_entropy: bool = True,
+    types: Optional[Set[PIIType]] = None,
+) -> Sequence[Tuple[PIIType, MaskingType]]:
+    """
+    Run all relevant per-value detectors over a cell in one fused pass.
+
+    Args:
+        value: Stripped cell value to classify
+        need_credit_card: Whether the caller cares about credit cards;
+            when False the Luhn check is skipped entirely
+        need_entropy: Whether the caller cares about high-entropy tokens;
+            when False the entropy check is skipped entirely
+        types: Optional interest set of PIITypes; pattern matchers (and
+            the Luhn/entropy detectors) for any other type are skipped
+
+    Returns:
+        Sequence of (PIIType, MaskingType) tuples for all matches,
+        pattern matches first, then credit card, then high-entropy token
+    """
+    if types is not None:
+        need_credit_card = need_credit_card and PIIType.CREDIT_CARD in types
+        need_entropy = need_entropy and PIIType.HIGH_ENTROPY_TOKEN in types
+
+    # Immutable (possibly shared) tuple; only copied if there is something
+    # to add, so the dominant no-PII path allocates nothing
+    matches = detect_pii_in_value(value, types)
+
+    extra: Optional[List[Tuple[PIIType, MaskingType]]] = None
+    if need_credit_card:
+        digit_count = sum(ch.isdigit() for ch in value)
+        if _CC_MIN_DIGITS <= digit_count <= _CC_MAX_DIGITS and is_credit_card(value):
+            extra = [(PIIType.CREDIT_CARD, detect_credit_card_masking(value))]
+
+    if need_entropy and len(value) >= _ENTROPY_MIN_LEN and " " not in value:
+        if is_high_entropy_token(value):
+            if extra is None:
+                extra = []
+            extra.append((PIIType.HIGH_ENTROPY_TOKEN, MaskingType.PLAINTEXT))
+
+    if extra is None:
+        return matches
+    return [*matches, *extra]
@@ -1,8 +1,51 @@
 """Luhn algorithm validator for credit card numbers."""
 
 import re
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
 from piileaktest.models import MaskingType
 
+# Separator-strip table applied once per value; str.translate runs at
+# C speed versus a regex substitution.
+_SEP_TABLE = str.maketrans("", "", " \t\r\n-")
+
+# Both masking shapes in one alternation: a full hex digest
+# (MD5/SHA-1/SHA-256) or any mask character anywhere. One search decides
+# the masking type; lastgroup tells which branch fired. The branches are
+# disjoint (hex never contains '*', 'X' or 'x'), and testing '*', 'X' and
+# 'x' directly avoids the upper-cased copy the old check allocated.
+_MASK_SHAPE_PATTERN = re.compile(
+    r"(?P<hash>^[a-fA-F0-9]{32,64}$)|(?P<partial>[*Xx])", re.ASCII
+)
+
+# Digit-doubling with the Luhn fold (double, then subtract 9 if >= 10),
+# precomputed for the ten possible digits.
+_DOUBLED = (0, 2, 4, 6, 8, 1, 3, 5, 7, 9)
+
+
+def _make_specialized_luhn(length: int):
+    """Synthesize a fully unrolled checksum function for one length."""
+    terms = []
+    for i in range(length):
+        # Every second digit from the right goes through the fold table
+        if (length - 1 - i) % 2 == 1:
+            terms.append(f"_D[ord(s[{i}]) - 48]")
+        else:
+            terms.append(f"ord(s[{i}]) - 48")
+    src = f"def _luhn{length}(s, _D=_DOUBLED):\n    return ({' + '.join(terms)}) % 10 == 0\n"
+    namespace = {"_DOUBLED": _DOUBLED}
+    exec(src, namespace)
+    return namespace[f"_luhn{length}"]
+
+
+# Card numbers are always 13-19 digits once cleaned; a straight-line
+# unrolled function per length avoids the loop and branch overhead of the
+# general walk below.
+_LUHN_SPECIALIZED = {length: _make_specialized_luhn(length) for length in range(13, 20)}
+
 
 def luhn_checksum(card_number: str) -> bool:
     """
@@ -14,23 +57,29 @@ def luhn_checksum(card_number: str) -> bool:
     Returns:
         True if valid according to Luhn algorithm
     """
-
-    def digits_of(n):
-        return [int(d) for d in str(n)]
-
-    digits = digits_of(card_number)
-    odd_digits = digits[-1::-2]
-    even_digits = digits[-2::-2]
-    checksum = sum(odd_digits)
-    for d in even_digits:
-        checksum += sum(digits_of(d * 2))
+    specialized = _LUHN_SPECIALIZED.get(len(card_number))
+    if specialized is not None:
+        return specialized(card_number)
+
+    # Walk right-to-left once with the precomputed doubled-digit table;
+    # no intermediate lists or str round-trips
+    checksum = 0
+    double = False
+    for ch in reversed(card_number):
+        d = ord(ch) - 48
+        checksum += _DOUBLED[d] if double else d
+        double = not double
     return checksum % 10 == 0
 
 
+@lru_cache(maxsize=1 << 16)
 def is_credit_card(value: str) -> bool:
     """
     Check if a value is a valid credit card number.
 
+    Results are memoized: real datasets repeat values heavily, so
+    duplicate cells cost one dict hit instead of a revalidation.
+
     Args:
         value: String to check
 
@@ -41,10 +90,10 @@ def is_credit_card(value: str) -> bool:
         return False
 
     # Remove common separators
-    cleaned = re.sub(r"[\s\-]", "", value)
+    cleaned = value.translate(_SEP_TABLE)
 
     # Check if it's all digits and reasonable length (13-19 digits)
-    if not cleaned.isdigit() or len(cleaned) < 13 or len(cleaned) > 19:
+    if not 13 <= len(cleaned) <= 19 or not cleaned.isdigit() or not cleaned.isascii():
         return False
 
     # Reject all zeros or all same digit (invalid cards)
@@ -67,17 +116,97 @@ def detect_credit_card_masking(value: str) -> MaskingType:
     """
     if not isinstance(value, str):
         return MaskingType.PLAINTEXT
+    return _masking_cached(value)
 
-    # Check for hash (32, 40, or 64 hex characters)
-    if re.match(r"^[a-fA-F0-9]{32,64}$", value):
-        return MaskingType.HASH
 
-    # Check for partial masking: ****1234 or **** **** **** 1234
-    if "*" in value or "X" in value.upper():
-        return MaskingType.PARTIAL_MASK
-
-    # Check if it's a valid plaintext card
-    if is_credit_card(value):
-        return MaskingType.PLAINTEXT
+@lru_cache(maxsize=1 << 16)
+def _masking_cached(value: str) -> MaskingType:
+    """Memoized masking-shape classification (duplicate values hit the cache)."""
+    # Hash (32, 40, or 64 hex chars) or partial masking (****1234,
+    # **** **** **** 1234, XXXX-...-1234) decided in a single pass
+    match = _MASK_SHAPE_PATTERN.search(value)
+    if match is not None:
+        return MaskingType.HASH if match.lastgroup == "hash" else MaskingType.PARTIAL_MASK
 
+    # Anything else (valid plaintext card or not) is plaintext
     return MaskingType.PLAINTEXT
+
+
+def credit_card_mask(series: pd.Series) -> pd.Series:
+    """
+    Vectorized is_credit_card over a whole column.
+
+    Strips separators, checks shape and runs the Luhn checksum entirely
+    in pandas/NumPy, so large columns never enter a per-cell Python
+    loop. Left-padding with zeros is safe: a zero digit contributes
+    nothing to the checksum whether doubled or not.
+
+    Args:
+        series: Column of values to test
+
+    Returns:
+        Boolean Series (aligned to the input index), True where the
+        value is a valid credit card number
+    """
+    cleaned = series.astype(str).str.replace(r"[\s\-]", "", regex=True)
+    lengths = cleaned.str.len()
+    candidate = lengths.between(13, 19) & cleaned.str.isdigit() & cleaned.str.isascii()
+
+    result = pd.Series(False, index=series.index)
+    if not candidate.any():
+        return result
+
+    # Fixed-width digit matrix: zfill to 19 then reinterpret the ASCII
+    # bytes as one (n, 19) uint8 array
+    padded = cleaned[candidate].str.zfill(19).to_numpy().astype("S19")
+    digits = np.frombuffer(padded.tobytes(), np.uint8).reshape(-1, 19).astype(np.int16) - ord("0")
+
+    # Reject all-same-digit numbers (mirroring is_credit_card), looking
+    # only at the unpadded suffix of each row
+    real = np.arange(19) >= (19 - lengths[candidate].to_numpy()[:, None])
+    all_same = ((digits == digits[:, -1:]) | ~real).all(axis=1)
+
+    # Double every second digit from the right (odd offsets in a
+    # 19-wide row) and fold >9 back down, branchlessly
+    doubled = digits * 2
+    doubled -= 9 * (doubled > 9)
+    is_doubled = (np.arange(19) % 2) == 1
+    checksum = np.where(is_doubled, doubled, digits).sum(axis=1)
+
+    result[candidate] = ~all_same & ((checksum % 10) == 0)
+    return result
+
+
+def credit_card_masking_vec(series: pd.Series) -> pd.Series:
+    """
+    Vectorized detect_credit_card_masking over a whole column.
+
+    The hash and mask-character predicates run as pyarrow compute
+    kernels (one pass each over the contiguous string buffer); the
+    column never enters a per-cell Python loop.
+
+    Args:
+        series: Column of credit card values (possibly masked)
+
+    Returns:
+        Series of MaskingType values aligned to the input index
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    arr = pa.array(series.astype(str), type=pa.string())
+    is_hash = pc.match_substring_regex(arr, r"^[a-fA-F0-9]{32,64}$").to_numpy(
+        zero_copy_only=False
+    )
+    has_mask_char = pc.or_(
+        pc.match_substring(arr, "*"),
+        pc.match_substring(pc.utf8_upper(arr), "X"),
+    ).to_numpy(zero_copy_only=False)
+
+    # Assemble as object dtype end to end: numpy and pandas would both
+    # coerce the str-enum members to plain strings otherwise
+    result = np.empty(len(series), dtype=object)
+    result[:] = MaskingType.PLAINTEXT
+    result[has_mask_char] = MaskingType.PARTIAL_MASK
+    result[is_hash] = MaskingType.HASH
+    return pd.Series(result, index=series.index, dtype=object)
@@ -1,15 +1,52 @@
 """Value pattern matchers for detecting PII in data."""
 
 import re
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Sequence
+
+import pandas as pd
+
 from piileaktest.models import PIIType, MaskingType
 
 
+# Hex digests (MD5/SHA-1/SHA-256) shared by every matcher's masking detection.
+# Unanchored: always invoked with fullmatch, which anchors implicitly and
+# takes a faster path than per-branch ^...$ handling
+_HASH_PATTERN = re.compile(r"[a-fA-F0-9]{32,64}", re.ASCII)
+
+
+def _is_ascii_digits(value: str) -> bool:
+    """True when value is one or more ASCII digits (regex \\d+ under re.ASCII)."""
+    return bool(value) and value.isascii() and value.isdigit()
+
+
+def _is_ipv4(value: str) -> bool:
+    """
+    Direct dotted-quad parse, equivalent to the IPv4 octet regex.
+
+    str.split plus int bounds checks run as straight C string ops with no
+    backtracking across the octet alternatives.
+    """
+    parts = value.split(".")
+    if len(parts) != 4:
+        return False
+    for part in parts:
+        # The regex accepts 1-3 ASCII digits per octet (leading zeros
+        # included) with a value of at most 255
+        if not 1 <= len(part) <= 3 or not part.isdigit() or not part.isascii():
+            return False
+        if int(part) > 255:
+            return False
+    return True
+
+
 class PatternMatcher:
     """Base class for PII pattern matching."""
 
-    def __init__(self):
-        self.pii_type: Optional[PIIType] = None
+    # Patterns live on the class, compiled once at import: instances carry
+    # no state, so constructing a matcher is free and transient instances
+    # (tests, ad-hoc callers) never recompile anything.
+    pii_type: Optional[PIIType] = None
 
     def matches(self, value: str) -> bool:
         """Check if value matches the pattern."""
@@ -23,14 +60,14 @@ class PatternMatcher:
 class EmailMatcher(PatternMatcher):
     """Matcher for email addresses."""
 
-    def __init__(self):
-        super().__init__()
-        self.pii_type = PIIType.EMAIL
-        # Standard email pattern
-        self.pattern = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
-        # Masked email patterns - more flexible to catch j***@e***.com format
-        self.masked_pattern = re.compile(r"^[a-zA-Z0-9*._%-]+@[a-zA-Z0-9*.-]+\.[a-zA-Z*]{2,}$")
-        self.hash_pattern = re.compile(r"^[a-fA-F0-9]{32,64}$")
+    pii_type = PIIType.EMAIL
+    # Standard email pattern
+    pattern = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}", re.ASCII)
+    # Masked email patterns - more flexible to catch j***@e***.com format
+    masked_pattern = re.compile(
+        r"[a-zA-Z0-9*._%-]+@[a-zA-Z0-9*.-]+\.[a-zA-Z*]{2,}", re.ASCII
+    )
+    hash_pattern = _HASH_PATTERN
 
     def matches(self, value: str) -> bool:
         """Check if value is an email or masked email."""
@@ -39,16 +76,18 @@ class EmailMatcher(PatternMatcher):
         value = value.strip()
         # Check if it contains @ and looks email-like (including masked)
         if '@' in value and '.' in value:
-            return bool(self.pattern.match(value) or self.masked_pattern.match(value))
+            return bool(
+                self.pattern.fullmatch(value) or self.masked_pattern.fullmatch(value)
+            )
         return False
 
     def detect_masking(self, value: str) -> MaskingType:
         """Detect masking type for email."""
-        if self.hash_pattern.match(value):
+        if self.hash_pattern.fullmatch(value):
             return MaskingType.HASH
         elif "*" in value:
             return MaskingType.PARTIAL_MASK
-        elif self.pattern.match(value):
+        elif self.pattern.fullmatch(value):
             return MaskingType.PLAINTEXT
         return MaskingType.PLAINTEXT
 
@@ -56,22 +95,20 @@ class EmailMatcher(PatternMatcher):
 class PhoneMatcher(PatternMatcher):
     """Matcher for US phone numbers."""
 
-    def __init__(self):
-        super().__init__()
-        self.pii_type = PIIType.PHONE
-        # Various US phone formats
-        self.patterns = [
-            re.compile(r"^\d{3}-\d{3}-\d{4}$"),
-            re.compile(r"^\(\d{3}\)\s*\d{3}-\d{4}$"),
-            re.compile(r"^\d{10}$"),
-            re.compile(r"^\+1\d{10}$"),
-        ]
-        # Masked patterns
-        self.masked_patterns = [
-            re.compile(r"\*+.*\d{4}"),
-            re.compile(r"\(\*+\).*\d{4}"),
-        ]
-        self.hash_pattern = re.compile(r"^[a-fA-F0-9]{32,64}$")
+    pii_type = PIIType.PHONE
+    # Various US phone formats
+    patterns = [
+        re.compile(r"\d{3}-\d{3}-\d{4}", re.ASCII),
+        re.compile(r"\(\d{3}\)\s*\d{3}-\d{4}", re.ASCII),
+        re.compile(r"\d{10}", re.ASCII),
+        re.compile(r"\+1\d{10}", re.ASCII),
+    ]
+    # Masked patterns
+    masked_patterns = [
+        re.compile(r"\*+.*\d{4}", re.ASCII),
+        re.compile(r"\(\*+\).*\d{4}", re.ASCII),
+    ]
+    hash_pattern = _HASH_PATTERN
 
     def matches(self, value: str) -> bool:
         """Check if value is a phone number."""
@@ -79,12 +116,17 @@ class PhoneMatcher(PatternMatcher):
             return False
         value = value.strip()
 
+        # Every accepted form starts with a digit, '(', '+' or '*'; anything
+        # else is rejected before the regex engine runs
+        if value[:1] not in "0123456789(+*":
+            return False
+
         # Check plaintext patterns
         for pattern in self.patterns:
-            if pattern.match(value):
+            if pattern.fullmatch(value):
                 return True
 
-        # Check masked patterns
+        # Check masked patterns (prefix matches by design, so .match stays)
         for pattern in self.masked_patterns:
             if pattern.match(value):
                 return True
@@ -93,13 +135,13 @@ class PhoneMatcher(PatternMatcher):
 
     def detect_masking(self, value: str) -> MaskingType:
         """Detect masking type for phone."""
-        if self.hash_pattern.match(value):
+        if self.hash_pattern.fullmatch(value):
             return MaskingType.HASH
         elif "*" in value:
             return MaskingType.PARTIAL_MASK
         else:
             for pattern in self.patterns:
-                if pattern.match(value):
+                if pattern.fullmatch(value):
                     return MaskingType.PLAINTEXT
         return MaskingType.PLAINTEXT
 
@@ -107,20 +149,18 @@ class PhoneMatcher(PatternMatcher):
 class SSNMatcher(PatternMatcher):
     """Matcher for US Social Security Numbers."""
 
-    def __init__(self):
-        super().__init__()
-        self.pii_type = PIIType.SSN
-        # SSN patterns: 123-45-6789 or 123456789
-        self.patterns = [
-            re.compile(r"^\d{3}-\d{2}-\d{4}$"),
-            re.compile(r"^\d{9}$"),
-        ]
-        # Masked patterns: ***-**-1234, XXX-XX-1234
-        self.masked_patterns = [
-            re.compile(r"^[\*X]{3}-[\*X]{2}-\d{4}$"),
-            re.compile(r"^[\*X]{5}\d{4}$"),
-        ]
-        self.hash_pattern = re.compile(r"^[a-fA-F0-9]{32,64}$")
+    pii_type = PIIType.SSN
+    # SSN patterns: 123-45-6789 or 123456789
+    patterns = [
+        re.compile(r"\d{3}-\d{2}-\d{4}", re.ASCII),
+        re.compile(r"\d{9}", re.ASCII),
+    ]
+    # Masked patterns: ***-**-1234, XXX-XX-1234
+    masked_patterns = [
+        re.compile(r"[\*X]{3}-[\*X]{2}-\d{4}", re.ASCII),
+        re.compile(r"[\*X]{5}\d{4}", re.ASCII),
+    ]
+    hash_pattern = _HASH_PATTERN
 
     def matches(self, value: str) -> bool:
         """Check if value is an SSN."""
@@ -128,27 +168,35 @@ class SSNMatcher(PatternMatcher):
             return False
         value = value.strip()
 
-        # Check plaintext
-        for pattern in self.patterns:
-            if pattern.match(value):
+        # Both plain and masked forms are 9 or 11 chars; direct position
+        # checks decide each shape with no regex at all
+        n = len(value)
+        if n == 9:
+            # 123456789 or *****1234 / XXXXX1234
+            if value.isascii() and value.isdigit():
                 return True
-
-        # Check masked
-        for pattern in self.masked_patterns:
-            if pattern.match(value):
+            return all(ch in "*X" for ch in value[:5]) and _is_ascii_digits(value[5:])
+        if n == 11:
+            if value[3] != "-" or value[6] != "-":
+                return False
+            area, group, serial = value[:3], value[4:6], value[7:]
+            if not _is_ascii_digits(serial):
+                return False
+            # 123-45-6789 or ***-**-6789 / XXX-XX-6789
+            if _is_ascii_digits(area) and _is_ascii_digits(group):
                 return True
-
+            return all(ch in "*X" for ch in area) and all(ch in "*X" for ch in group)
         return False
 
     def detect_masking(self, value: str) -> MaskingType:
         """Detect masking type for SSN."""
-        if self.hash_pattern.match(value):
+        if self.hash_pattern.fullmatch(value):
             return MaskingType.HASH
         elif "*" in value or "X" in value:
             return MaskingType.PARTIAL_MASK
         else:
             for pattern in self.patterns:
-                if pattern.match(value):
+                if pattern.fullmatch(value):
                     return MaskingType.PLAINTEXT
         return MaskingType.PLAINTEXT
 
@@ -156,25 +204,24 @@ class SSNMatcher(PatternMatcher):
 class IPAddressMatcher(PatternMatcher):
     """Matcher for IP addresses."""
 
-    def __init__(self):
-        super().__init__()
-        self.pii_type = PIIType.IP_ADDRESS
-        # IPv4 pattern
-        self.pattern = re.compile(
-            r"^(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}"
-            r"(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$"
-        )
-        self.hash_pattern = re.compile(r"^[a-fA-F0-9]{32,64}$")
+    pii_type = PIIType.IP_ADDRESS
+    # IPv4 pattern
+    pattern = re.compile(
+        r"(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}"
+        r"(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)",
+        re.ASCII,
+    )
+    hash_pattern = _HASH_PATTERN
 
     def matches(self, value: str) -> bool:
         """Check if value is an IP address."""
         if not isinstance(value, str):
             return False
-        return bool(self.pattern.match(value.strip()))
+        return _is_ipv4(value.strip())
 
     def detect_masking(self, value: str) -> MaskingType:
         """Detect masking type for IP."""
-        if self.hash_pattern.match(value):
+        if self.hash_pattern.fullmatch(value):
             return MaskingType.HASH
         elif "*" in value:
             return MaskingType.PARTIAL_MASK
@@ -184,22 +231,23 @@ class IPAddressMatcher(PatternMatcher):
 class ZipCodeMatcher(PatternMatcher):
     """Matcher for US ZIP codes."""
 
-    def __init__(self):
-        super().__init__()
-        self.pii_type = PIIType.ZIP_CODE
-        # US ZIP: 12345 or 12345-6789
-        self.patterns = [
-            re.compile(r"^\d{5}$"),
-            re.compile(r"^\d{5}-\d{4}$"),
-        ]
+    pii_type = PIIType.ZIP_CODE
+    # US ZIP: 12345 or 12345-6789
+    patterns = [
+        re.compile(r"\d{5}", re.ASCII),
+        re.compile(r"\d{5}-\d{4}", re.ASCII),
+    ]
 
     def matches(self, value: str) -> bool:
         """Check if value is a ZIP code."""
         if not isinstance(value, str):
             return False
         value = value.strip()
+        # 12345 or 12345-6789: any other length cannot match
+        if len(value) not in (5, 10):
+            return False
         for pattern in self.patterns:
-            if pattern.match(value):
+            if pattern.fullmatch(value):
                 return True
         return False
 
@@ -211,23 +259,24 @@ class ZipCodeMatcher(PatternMatcher):
 class DOBMatcher(PatternMatcher):
     """Matcher for dates of birth."""
 
-    def __init__(self):
-        super().__init__()
-        self.pii_type = PIIType.DOB
-        # Common date formats
-        self.patterns = [
-            re.compile(r"^\d{4}-\d{2}-\d{2}$"),  # YYYY-MM-DD
-            re.compile(r"^\d{2}/\d{2}/\d{4}$"),  # MM/DD/YYYY
-            re.compile(r"^\d{2}-\d{2}-\d{4}$"),  # MM-DD-YYYY
-        ]
+    pii_type = PIIType.DOB
+    # Common date formats
+    patterns = [
+        re.compile(r"\d{4}-\d{2}-\d{2}", re.ASCII),  # YYYY-MM-DD
+        re.compile(r"\d{2}/\d{2}/\d{4}", re.ASCII),  # MM/DD/YYYY
+        re.compile(r"\d{2}-\d{2}-\d{4}", re.ASCII),  # MM-DD-YYYY
+    ]
 
     def matches(self, value: str) -> bool:
         """Check if value looks like a date of birth."""
         if not isinstance(value, str):
             return False
         value = value.strip()
+        # All three accepted formats are exactly 10 chars
+        if len(value) != 10:
+            return False
         for pattern in self.patterns:
-            if pattern.match(value):
+            if pattern.fullmatch(value):
                 # Additional check: year should be reasonable for DOB
                 if "19" in value or "20" in value:
                     return True
@@ -243,32 +292,37 @@ class DOBMatcher(PatternMatcher):
 class AccountNumberMatcher(PatternMatcher):
     """Matcher for account numbers."""
 
-    def __init__(self):
-        super().__init__()
-        self.pii_type = PIIType.ACCOUNT_NUMBER
-        # Generic account number: 8-16 digits
-        self.pattern = re.compile(r"^\d{8,16}$")
-        self.masked_pattern = re.compile(r"^\*+\d{4}$")
-        self.hash_pattern = re.compile(r"^[a-fA-F0-9]{32,64}$")
+    pii_type = PIIType.ACCOUNT_NUMBER
+    # Generic account number: 8-16 digits
+    pattern = re.compile(r"\d{8,16}", re.ASCII)
+    masked_pattern = re.compile(r"\*+\d{4}", re.ASCII)
+    hash_pattern = _HASH_PATTERN
 
     def matches(self, value: str) -> bool:
         """Check if value looks like an account number."""
         if not isinstance(value, str):
             return False
         value = value.strip()
-        return bool(self.pattern.match(value) or self.masked_pattern.match(value))
+        # Both forms start with a digit or '*'
+        if value[:1] not in "0123456789*":
+            return False
+        return bool(
+            self.pattern.fullmatch(value) or self.masked_pattern.fullmatch(value)
+        )
 
     def detect_masking(self, value: str) -> MaskingType:
         """Detect masking for account numbers."""
-        if self.hash_pattern.match(value):
+        if self.hash_pattern.fullmatch(value):
             return MaskingType.HASH
         elif "*" in value:
             return MaskingType.PARTIAL_MASK
         return MaskingType.PLAINTEXT
 
 
-# Registry of all matchers
-MATCHERS = [
+# Registry of all matchers. A tuple: the matchers are stateless, built
+# once at import, and shared by every caller (including the scan worker
+# processes), so the registry is immutable by construction.
+MATCHERS = (
     EmailMatcher(),
     PhoneMatcher(),
     SSNMatcher(),
@@ -276,28 +330,202 @@ MATCHERS = [
     ZipCodeMatcher(),
     DOBMatcher(),
     AccountNumberMatcher(),
-]
+)
+
+# Fused pre-scan: a single unanchored union of the coarse shapes required by
+# every registered matcher (plain or masked). One C-level pass over the value
+# decides whether any matcher could possibly fire, so values that cannot match
+# skip the per-matcher dispatch entirely.
+_PRESCAN_PATTERN = re.compile(
+    r"@"  # email (plain or masked)
+    r"|\*"  # masked phone/SSN/account
+    r"|X{2}"  # X-style masking
+    r"|\d{5}"  # zip, bare SSN/phone/account digit runs
+    r"|\d{2}[/-]\d{2}"  # SSN/DOB/phone separators
+    r"|\(\d{3}\)"  # (555) 123-4567
+    r"|\d{1,3}\.\d{1,3}\."  # IPv4
+)
+_prescan_search = _PRESCAN_PATTERN.search
+
+# Every matcher pattern fused into one regex, evaluated with a single
+# C-level match call instead of ~15 separate re.match invocations. Each
+# branch sits inside an optional lookahead so overlapping matches are all
+# reported (a 9-digit run is both an SSN and an account number, exactly as
+# the per-matcher loop found), and the winning group name also encodes the
+# masking variant, so no detect_masking call runs afterwards: the disjoint
+# plain/masked pattern pairs make the group itself the masking verdict.
+# Only EMAIL needs a post-check ('*' presence), because its masked pattern
+# also accepts unmasked addresses. Branches are kept per type so a trimmed
+# pattern can be specialized for any interest set.
+_BRANCHES = (
+    (
+        PIIType.EMAIL,
+        r"(?=(?P<email>"
+        r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
+        r"|[a-zA-Z0-9*._%-]+@[a-zA-Z0-9*.-]+\.[a-zA-Z*]{2,}$))?",
+    ),
+    (
+        PIIType.PHONE,
+        r"(?=(?P<phone_plain>(?:\d{3}-\d{3}-\d{4}|\(\d{3}\)\s*\d{3}-\d{4}|\d{10}|\+1\d{10})$))?"
+        r"(?=(?P<phone_mask>\*+.*\d{4}|\(\*+\).*\d{4}))?",
+    ),
+    (
+        PIIType.SSN,
+        r"(?=(?P<ssn_plain>(?:\d{3}-\d{2}-\d{4}|\d{9})$))?"
+        r"(?=(?P<ssn_mask>(?:[*X]{3}-[*X]{2}-\d{4}|[*X]{5}\d{4})$))?",
+    ),
+    (
+        PIIType.IP_ADDRESS,
+        r"(?=(?P<ip>(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}"
+        r"(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$))?",
+    ),
+    (PIIType.ZIP_CODE, r"(?=(?P<zip>\d{5}(?:-\d{4})?$))?"),
+    (
+        PIIType.DOB,
+        r"(?=(?P<dob>(?=.*(?:19|20))(?:\d{4}-\d{2}-\d{2}|\d{2}/\d{2}/\d{4}|\d{2}-\d{2}-\d{4})$))?",
+    ),
+    (
+        PIIType.ACCOUNT_NUMBER,
+        r"(?=(?P<acct_plain>\d{8,16}$))?(?=(?P<acct_mask>\*+\d{4}$))?",
+    ),
+)
+
+_COMBINED_PATTERN = re.compile("".join(src for _, src in _BRANCHES), re.ASCII)
+
+
+@lru_cache(maxsize=64)
+def _pattern_for(types: Optional[frozenset]) -> "re.Pattern[str]":
+    """
+    Specialize the combined pattern to an interest set.
 
+    A policy restricting the check to a few PII types gets a trimmed
+    regex containing only those branches, so excluded patterns are never
+    even evaluated. Interest sets come from policies, so only a handful
+    of distinct specializations ever exist.
+    """
+    if types is None:
+        return _COMBINED_PATTERN
+    return re.compile(
+        "".join(src for pii_type, src in _BRANCHES if pii_type in types), re.ASCII
+    )
+
+
+@lru_cache(maxsize=1 << 16)
+def _detect_pii_cached(
+    value: str, types: Optional[frozenset]
+) -> tuple[tuple[PIIType, MaskingType], ...]:
+    """Memoized fused-regex dispatch; returns an immutable result tuple."""
+    # All lookaheads are optional, so the match object always exists
+    group = _pattern_for(types).match(value).group
+    results = []
 
-def detect_pii_in_value(value: str) -> list[tuple[PIIType, MaskingType]]:
+    # Branches kept in MATCHERS order so results are reported as before
+    if (types is None or PIIType.EMAIL in types) and group("email") is not None:
+        masking = MaskingType.PARTIAL_MASK if "*" in value else MaskingType.PLAINTEXT
+        results.append((PIIType.EMAIL, masking))
+    if types is None or PIIType.PHONE in types:
+        if group("phone_plain") is not None:
+            results.append((PIIType.PHONE, MaskingType.PLAINTEXT))
+        elif group("phone_mask") is not None:
+            results.append((PIIType.PHONE, MaskingType.PARTIAL_MASK))
+    if types is None or PIIType.SSN in types:
+        if group("ssn_plain") is not None:
+            results.append((PIIType.SSN, MaskingType.PLAINTEXT))
+        elif group("ssn_mask") is not None:
+            results.append((PIIType.SSN, MaskingType.PARTIAL_MASK))
+    if (types is None or PIIType.IP_ADDRESS in types) and group("ip") is not None:
+        results.append((PIIType.IP_ADDRESS, MaskingType.PLAINTEXT))
+    if (types is None or PIIType.ZIP_CODE in types) and group("zip") is not None:
+        results.append((PIIType.ZIP_CODE, MaskingType.PLAINTEXT))
+    if (types is None or PIIType.DOB in types) and group("dob") is not None:
+        results.append((PIIType.DOB, MaskingType.PLAINTEXT))
+    if types is None or PIIType.ACCOUNT_NUMBER in types:
+        if group("acct_plain") is not None:
+            results.append((PIIType.ACCOUNT_NUMBER, MaskingType.PLAINTEXT))
+        elif group("acct_mask") is not None:
+            results.append((PIIType.ACCOUNT_NUMBER, MaskingType.PARTIAL_MASK))
+
+    return tuple(results)
+
+
+# Shared no-match result: the dominant outcome of a scan is "no PII", and
+# every such call returns this one tuple instead of allocating a fresh list.
+_EMPTY_RESULT: tuple = ()
+
+
+def detect_pii_in_value(
+    value: str, types: Optional[set] = None
+) -> Sequence[tuple[PIIType, MaskingType]]:
     """
     Detect PII types and masking in a single value.
 
+    Duplicate values hit an LRU cache: real datasets repeat cells
+    heavily (enums, placeholders), so repeated strings cost one dict
+    lookup instead of a full matcher pass.
+
     Args:
         value: The value to check
+        types: Optional interest set of PIITypes; matchers for any other
+            type are skipped entirely
 
     Returns:
-        List of (PIIType, MaskingType) tuples for all matches
+        Immutable sequence of (PIIType, MaskingType) tuples for all
+        matches (shared empty tuple when nothing matched)
     """
-    if not isinstance(value, str) or not value.strip():
-        return []
+    if not isinstance(value, str):
+        return _EMPTY_RESULT
 
-    results = []
-    value = str(value).strip()
+    # One strip, reused everywhere below (the guard above used to strip a
+    # second throwaway copy). isinstance stays rather than an exact type
+    # check: numpy's str_ is a str subclass and must keep matching.
+    value = value.strip()
+    if not value:
+        return _EMPTY_RESULT
+
+    # Single fused scan over all pattern shapes; bail out before touching
+    # the individual matchers (and the cache) when nothing can match.
+    if not _prescan_search(value):
+        return _EMPTY_RESULT
 
-    for matcher in MATCHERS:
-        if matcher.matches(value):
-            masking = matcher.detect_masking(value)
-            results.append((matcher.pii_type, masking))
+    # The cached tuple is immutable, so it is returned as-is: no copy
+    return _detect_pii_cached(value, frozenset(types) if types is not None else None)
+
+
+def detect_pii_in_column(series: pd.Series) -> pd.Series:
+    """
+    Detect PII across a whole column in one batched pass.
 
-    return results
+    The null-drop, str conversion and strip run vectorized, and the
+    coarse prescan runs as a single pyarrow regex kernel over the
+    contiguous string buffer, so the per-value detector (with its LRU
+    cache) only ever sees cells that could possibly match. Callers
+    scanning columns should prefer this over a Python-level loop around
+    :func:`detect_pii_in_value`.
+
+    Args:
+        series: Column of values to scan
+
+    Returns:
+        Object Series aligned to the input index whose entries are the
+        (PIIType, MaskingType) result tuples for each cell (empty tuple
+        where nothing matched)
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    results = [()] * len(series)
+
+    # Positional index so duplicate labels cannot misalign assignment
+    cells = series.reset_index(drop=True).dropna().astype(str).str.strip()
+    cells = cells[cells != ""]
+    if len(cells):
+        arr = pa.array(cells.to_numpy(), type=pa.string())
+        mask = pc.match_substring_regex(arr, _PRESCAN_PATTERN.pattern)
+        candidates = cells[mask.to_numpy(zero_copy_only=False)]
+        detect = _detect_pii_cached
+        for pos, value in zip(candidates.index.to_numpy(), candidates.to_numpy()):
+            hit = detect(value, None)
+            if hit:
+                results[pos] = hit
+
+    return pd.Series(results, index=series.index, dtype=object)
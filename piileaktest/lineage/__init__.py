@@ -1,6 +1,8 @@
 """Lineage package for PIILeakTest."""
 
 from piileaktest.lineage.flow_loader import (
+    LineageIndex,
+    get_lineage_index,
     load_lineage_graph,
     get_upstream_datasets,
     get_downstream_datasets,
@@ -16,6 +18,8 @@ from piileaktest.lineage.graph_trace import (
 )
 
 __all__ = [
+    "LineageIndex",
+    "get_lineage_index",
     "load_lineage_graph",
     "get_upstream_datasets",
     "get_downstream_datasets",
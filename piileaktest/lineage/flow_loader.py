@@ -1,9 +1,76 @@
 """Data lineage flow loader."""
 
-from typing import List, Dict, Set
+import sys
+import weakref
+from dataclasses import dataclass
+from typing import List, Dict, Set, Tuple
 from piileaktest.models import LineageEdge, SuiteConfig
 
 
+@dataclass(slots=True, frozen=True)
+class LineageIndex:
+    """
+    Prebuilt adjacency and endpoint indices for one suite's lineage.
+
+    Built once per config and cached, so the per-finding lineage queries
+    are dict/set lookups instead of O(edges) scans.
+    """
+
+    forward: Dict[str, List[str]]
+    reverse: Dict[str, List[str]]
+    sources: frozenset
+    sinks: frozenset
+
+
+# Indices memoized per config object, keyed by id() with a weakref that
+# both validates the key (id reuse) and evicts the entry when the config
+# is garbage collected.
+_index_cache: Dict[int, Tuple["weakref.ref", LineageIndex]] = {}
+
+
+def get_lineage_index(config: SuiteConfig) -> LineageIndex:
+    """
+    Return (building if needed) the cached lineage index for a config.
+
+    Args:
+        config: Suite configuration with lineage edges
+
+    Returns:
+        LineageIndex with forward/reverse adjacency and source/sink sets
+    """
+    key = id(config)
+    entry = _index_cache.get(key)
+    if entry is not None and entry[0]() is config:
+        return entry[1]
+
+    forward: Dict[str, List[str]] = {}
+    reverse: Dict[str, List[str]] = {}
+    # Interned names make every dict/set probe below (and in the graph
+    # traversals keyed off this index) an identity comparison first
+    intern = sys.intern
+    for edge in config.lineage:
+        source = intern(edge.source)
+        target = intern(edge.target)
+        forward.setdefault(source, []).append(target)
+        reverse.setdefault(target, []).append(source)
+
+    all_datasets = {intern(ds.name) for ds in config.datasets}
+    index = LineageIndex(
+        forward=forward,
+        reverse=reverse,
+        # Sources are datasets that are never targets; sinks are datasets
+        # that are never sources
+        sources=frozenset(all_datasets - reverse.keys()),
+        sinks=frozenset(all_datasets - forward.keys()),
+    )
+
+    _index_cache[key] = (
+        weakref.ref(config, lambda _, k=key: _index_cache.pop(k, None)),
+        index,
+    )
+    return index
+
+
 def load_lineage_graph(config: SuiteConfig) -> Dict[str, List[str]]:
     """
     Load lineage graph from suite configuration.
@@ -16,14 +83,8 @@ def load_lineage_graph(config: SuiteConfig) -> Dict[str, List[str]]:
     Returns:
         Dictionary mapping source datasets to list of target datasets
     """
-    graph: Dict[str, List[str]] = {}
-
-    for edge in config.lineage:
-        if edge.source not in graph:
-            graph[edge.source] = []
-        graph[edge.source].append(edge.target)
-
-    return graph
+    # Fresh copy so callers can mutate without poisoning the cached index
+    return {source: list(targets) for source, targets in get_lineage_index(config).forward.items()}
 
 
 def get_upstream_datasets(dataset_name: str, config: SuiteConfig) -> List[str]:
@@ -37,11 +98,7 @@ def get_upstream_datasets(dataset_name: str, config: SuiteConfig) -> List[str]:
     Returns:
         List of upstream dataset names
     """
-    upstream = []
-    for edge in config.lineage:
-        if edge.target == dataset_name:
-            upstream.append(edge.source)
-    return upstream
+    return list(get_lineage_index(config).reverse.get(dataset_name, ()))
 
 
 def get_downstream_datasets(dataset_name: str, config: SuiteConfig) -> List[str]:
@@ -55,11 +112,7 @@ def get_downstream_datasets(dataset_name: str, config: SuiteConfig) -> List[str]
     Returns:
         List of downstream dataset names
     """
-    downstream = []
-    for edge in config.lineage:
-        if edge.source == dataset_name:
-            downstream.append(edge.target)
-    return downstream
+    return list(get_lineage_index(config).forward.get(dataset_name, ()))
 
 
 def get_all_lineage_edges(config: SuiteConfig) -> List[LineageEdge]:
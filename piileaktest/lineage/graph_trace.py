@@ -1,7 +1,8 @@
 """Graph tracing utilities for finding leakage paths."""
 
-from typing import List, Optional, Set, Dict
+from typing import List, Optional, Set, Dict, Tuple
 from piileaktest.models import SuiteConfig, LineageEdge, PIIType
+from piileaktest.lineage.flow_loader import get_lineage_index
 
 
 def find_path_to_source(
@@ -11,7 +12,9 @@ def find_path_to_source(
     """
     Find all paths from source datasets to the target dataset.
 
-    Uses BFS to find all paths through the lineage graph.
+    Walks the (cached) reverse lineage graph with an explicit-stack DFS;
+    one mutable path list is maintained with pop-on-backtrack, so no
+    per-step path or visited-set copies are made.
 
     Args:
         target_dataset: The dataset to find paths to
@@ -20,34 +23,39 @@ def find_path_to_source(
     Returns:
         List of paths, where each path is a list of dataset names
     """
-    # Build reverse graph (target -> sources)
-    reverse_graph: Dict[str, List[str]] = {}
-    for edge in config.lineage:
-        if edge.target not in reverse_graph:
-            reverse_graph[edge.target] = []
-        reverse_graph[edge.target].append(edge.source)
-
-    # Find all paths using DFS
-    paths = []
-
-    def dfs(current: str, path: List[str], visited: Set[str]):
-        """Depth-first search to find all paths."""
-        if current in visited:
-            return  # Avoid cycles
-
-        path = path + [current]
-        visited = visited | {current}
-
-        # If no upstream, this is a source - record the path
-        if current not in reverse_graph or not reverse_graph[current]:
+    reverse_graph = get_lineage_index(config).reverse
+
+    paths: List[List[str]] = []
+    path: List[str] = []
+    on_path: Set[str] = set()
+
+    # (node, backtrack) entries: the True entry pops the node off the path
+    # once its whole subtree has been explored
+    stack: List[Tuple[str, bool]] = [(target_dataset, False)]
+    while stack:
+        current, backtrack = stack.pop()
+        if backtrack:
+            path.pop()
+            on_path.discard(current)
+            continue
+        if current in on_path:
+            continue  # Avoid cycles
+
+        path.append(current)
+        on_path.add(current)
+        stack.append((current, True))
+
+        upstream = reverse_graph.get(current)
+        if not upstream:
+            # If no upstream, this is a source - record the path
             paths.append(list(reversed(path)))  # Reverse to show source -> target
-            return
+            continue
 
-        # Recurse to upstream datasets
-        for upstream in reverse_graph[current]:
-            dfs(upstream, path, visited)
+        # Push upstream datasets in reverse so they are explored in the
+        # same order the recursive version visited them
+        for up in reversed(upstream):
+            stack.append((up, False))
 
-    dfs(target_dataset, [], set())
     return paths
 
 
@@ -89,12 +97,7 @@ def get_all_sources(config: SuiteConfig) -> List[str]:
     Returns:
         List of source dataset names
     """
-    all_targets = {edge.target for edge in config.lineage}
-    all_datasets = {ds.name for ds in config.datasets}
-
-    # Sources are datasets that are never targets
-    sources = all_datasets - all_targets
-    return list(sources)
+    return list(get_lineage_index(config).sources)
 
 
 def get_all_sinks(config: SuiteConfig) -> List[str]:
@@ -107,18 +110,17 @@ def get_all_sinks(config: SuiteConfig) -> List[str]:
     Returns:
         List of sink dataset names
     """
-    all_sources = {edge.source for edge in config.lineage}
-    all_datasets = {ds.name for ds in config.datasets}
-
-    # Sinks are datasets that are never sources
-    sinks = all_datasets - all_sources
-    return list(sinks)
+    return list(get_lineage_index(config).sinks)
 
 
 def detect_cycles(config: SuiteConfig) -> List[List[str]]:
     """
     Detect cycles in the lineage graph.
 
+    Iterative DFS with an explicit frame stack: one mutable path list is
+    shared across the whole traversal (pop-on-backtrack), so descending a
+    level no longer copies the path.
+
     Args:
         config: Suite configuration
 
@@ -132,29 +134,46 @@ def detect_cycles(config: SuiteConfig) -> List[List[str]]:
             graph[edge.source] = []
         graph[edge.source].append(edge.target)
 
-    cycles = []
-    visited = set()
-    rec_stack = set()
-
-    def dfs(node: str, path: List[str]):
-        """DFS to detect cycles."""
-        visited.add(node)
-        rec_stack.add(node)
-        path = path + [node]
+    cycles: List[List[str]] = []
+    visited: Set[str] = set()
+    rec_stack: Set[str] = set()
+    path: List[str] = []
+    # Depth at which each on-path node was entered: cycle reconstruction
+    # becomes one dict lookup and a slice instead of an O(depth) scan of
+    # the path with list.index
+    enter_depth: Dict[str, int] = {}
 
-        if node in graph:
-            for neighbor in graph[node]:
+    for dataset in graph:
+        if dataset in visited:
+            continue
+
+        # Each frame holds a node and its partially consumed neighbor
+        # iterator, mirroring the recursive call's saved position
+        visited.add(dataset)
+        rec_stack.add(dataset)
+        enter_depth[dataset] = len(path)
+        path.append(dataset)
+        stack = [(dataset, iter(graph.get(dataset, ())))]
+
+        while stack:
+            node, neighbors = stack[-1]
+            descended = False
+            for neighbor in neighbors:
                 if neighbor not in visited:
-                    dfs(neighbor, path)
+                    visited.add(neighbor)
+                    rec_stack.add(neighbor)
+                    enter_depth[neighbor] = len(path)
+                    path.append(neighbor)
+                    stack.append((neighbor, iter(graph.get(neighbor, ()))))
+                    descended = True
+                    break
                 elif neighbor in rec_stack:
                     # Found a cycle
-                    cycle_start = path.index(neighbor)
-                    cycles.append(path[cycle_start:] + [neighbor])
-
-        rec_stack.remove(node)
-
-    for dataset in graph:
-        if dataset not in visited:
-            dfs(dataset, [])
+                    cycles.append(path[enter_depth[neighbor]:] + [neighbor])
+            if not descended:
+                stack.pop()
+                rec_stack.discard(node)
+                del enter_depth[node]
+                path.pop()
 
     return cycles
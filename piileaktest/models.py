@@ -1,5 +1,6 @@
 """Data models for PIILeakTest framework."""
 
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import List, Optional, Dict, Any
 from datetime import datetime
@@ -42,8 +43,16 @@ class MaskingType(str, Enum):
     TOKENIZED = "tokenized"  # replaced with token
 
 
-class Finding(BaseModel):
-    """Represents a single PII detection finding."""
+@dataclass(slots=True, frozen=True)
+class Finding:
+    """
+    Represents a single PII detection finding.
+
+    A plain slotted dataclass rather than a pydantic model: findings are
+    built in bulk inside the assertion scan loops from already-validated
+    values, so per-instance validation and __dict__ storage would only
+    add overhead.
+    """
 
     dataset: str
     column: str
@@ -68,8 +77,15 @@ class DatasetPolicy(BaseModel):
     hash_allowed_for: List[PIIType] = Field(default_factory=list)
 
 
-class LineageEdge(BaseModel):
-    """Represents a data lineage edge between datasets."""
+@dataclass(slots=True, frozen=True)
+class LineageEdge:
+    """
+    Represents a data lineage edge between datasets.
+
+    A slotted dataclass like Finding: pydantic still validates the dicts
+    parsed from YAML (dataclasses are supported field types), but the
+    per-edge objects carry no validation or __dict__ overhead afterwards.
+    """
 
     source: str
     target: str
@@ -101,17 +117,22 @@ class SuiteConfig(BaseModel):
     thresholds: ThresholdConfig = Field(default_factory=ThresholdConfig)
 
 
-class AssertionResult(BaseModel):
-    """Result of a single assertion."""
+@dataclass(slots=True, frozen=True)
+class AssertionResult:
+    """Result of a single assertion (slotted dataclass, like Finding)."""
 
     assertion_type: str
     dataset: str
     passed: bool
-    findings: List[Finding] = Field(default_factory=list)
+    findings: List[Finding] = field(default_factory=list)
     message: str = ""
     severity: Severity = Severity.INFO
 
 
+# Severities that gate CI, hashed once instead of rebuilding a list per check
+_FAIL_SEVERITIES = frozenset({Severity.CRITICAL, Severity.HIGH})
+
+
 class SuiteResult(BaseModel):
     """Overall result of running a test suite."""
 
@@ -124,13 +145,13 @@ class SuiteResult(BaseModel):
     assertion_results: List[AssertionResult] = Field(default_factory=list)
     overall_passed: bool = False
     execution_time_seconds: float = 0.0
-    summary: Dict[str, Any] = Field(default_factory=dict)
+    # Bare dict: validation only checks the container type instead of
+    # walking every key/value through Any handling
+    summary: dict = Field(default_factory=dict)
 
     def should_fail_ci(self) -> bool:
         """Determine if CI should fail based on severity thresholds."""
-        critical_high_failures = [
-            ar
+        return any(
+            not ar.passed and ar.severity in _FAIL_SEVERITIES
             for ar in self.assertion_results
-            if not ar.passed and ar.severity in [Severity.CRITICAL, Severity.HIGH]
-        ]
-        return len(critical_high_failures) > 0
+        )
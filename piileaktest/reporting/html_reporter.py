@@ -1,15 +1,21 @@
 """HTML reporter for PIILeakTest results."""
 
 from pathlib import Path
-from jinja2 import Template
-from piileaktest.models import SuiteResult
+from jinja2 import Environment
+from markupsafe import Markup, escape
+from piileaktest.models import MaskingType, PIIType, Severity, SuiteResult
 
-HTML_TEMPLATE = """<!DOCTYPE html>
+# Everything up to <body> is static apart from the suite name in the
+# title; it is written to the file directly so Jinja never re-walks the
+# ~170 lines of CSS text on each render
+_HTML_HEAD_PRE = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>PIILeakTest Report - {{ suite_name }}</title>
+    <title>PIILeakTest Report - """
+
+_HTML_HEAD_POST = """</title>
     <style>
         * {
             margin: 0;
@@ -176,6 +182,15 @@ HTML_TEMPLATE = """<!DOCTYPE html>
     </style>
 </head>
 <body>
+"""
+
+_HTML_TAIL = """</body>
+</html>
+"""
+
+# Only the dynamic report body runs through Jinja; the compiled
+# template's node tree is a fraction of the full document's
+HTML_TEMPLATE = """\
     <div class="container">
         <div class="header">
             <h1>🔒 PIILeakTest Report</h1>
@@ -210,39 +225,21 @@ HTML_TEMPLATE = """<!DOCTYPE html>
 
         <h2 style="margin: 30px 0 20px 0; color: #2c3e50;">Assertion Results</h2>
         
-        {% for assertion in assertion_results %}
+        {% for assertion, findings_html in assertion_results %}
         <div class="assertion {% if assertion.passed %}assertion-pass{% else %}assertion-fail{% endif %}">
             <h3>
                 {% if assertion.passed %}✓{% else %}✗{% endif %}
                 {{ assertion.assertion_type }} - {{ assertion.dataset }}
             </h3>
             <div class="assertion-meta">
-                <span class="severity severity-{{ assertion.severity }}">{{ assertion.severity }}</span>
+                <span class="severity severity-{{ sev_html[assertion.severity] }}">{{ sev_html[assertion.severity] }}</span>
                 <span>{{ assertion.message }}</span>
             </div>
-            
+
             {% if assertion.findings %}
             <div class="findings">
                 <strong>Findings ({{ assertion.findings|length }}):</strong>
-                {% for finding in assertion.findings %}
-                <div class="finding">
-                    <div class="finding-header">
-                        <span class="severity severity-{{ finding.severity }}">{{ finding.severity }}</span>
-                        Column: <span class="code">{{ finding.column }}</span> | 
-                        PII Type: <span class="code">{{ finding.pii_type }}</span> |
-                        Masking: <span class="code">{{ finding.masking_type }}</span>
-                    </div>
-                    <div class="finding-detail">
-                        {{ finding.message }}
-                        {% if finding.redacted_sample %}
-                        <br>Sample: <span class="code">{{ finding.redacted_sample }}</span>
-                        {% endif %}
-                        {% if finding.row_index is not none %}
-                        <br>Row Index: {{ finding.row_index }}
-                        {% endif %}
-                    </div>
-                </div>
-                {% endfor %}
+                {{ findings_html|safe }}
             </div>
             {% endif %}
         </div>
@@ -255,10 +252,54 @@ HTML_TEMPLATE = """<!DOCTYPE html>
             </p>
         </div>
     </div>
-</body>
-</html>
 """
 
+# One environment and one compiled template for the whole process: the
+# template never changes, so parsing and code generation happen once at
+# import instead of on every export. trim_blocks/lstrip_blocks drop the
+# whitespace-only text nodes the block tags would otherwise emit.
+_ENV = Environment(autoescape=True, trim_blocks=True, lstrip_blocks=True)
+_TEMPLATE = _ENV.from_string(HTML_TEMPLATE)
+
+# The per-finding block compiled on its own: the outer template runs
+# once per assertion, but this fragment runs once per finding, so the
+# hot inner loop executes a small dedicated program instead of walking
+# the whole report's node tree. Rendered with the same autoescaping
+# environment, the assembled fragments are safe to splice back in.
+FINDING_TEMPLATE = """\
+<div class="finding">
+    <div class="finding-header">
+        <span class="severity severity-{{ sev_html[finding.severity] }}">{{ sev_html[finding.severity] }}</span>
+        Column: <span class="code">{{ finding.column }}</span> |
+        PII Type: <span class="code">{{ pii_html[finding.pii_type] }}</span> |
+        Masking: <span class="code">{{ mask_html[finding.masking_type] }}</span>
+    </div>
+    <div class="finding-detail">
+        {{ finding.message }}
+        {% if has_sample %}
+        <br>Sample: <span class="code">{{ finding.redacted_sample }}</span>
+        {% endif %}
+        {% if has_row %}
+        <br>Row Index: {{ finding.row_index }}
+        {% endif %}
+    </div>
+</div>
+"""
+_FINDING_TEMPLATE = _ENV.from_string(FINDING_TEMPLATE)
+
+# The enum values come from closed ASCII sets and appear several times
+# per finding; escaping each member once at import lets autoescape skip
+# the markupsafe.escape call on every interpolation of these constants
+_SEV_HTML = {s: Markup(escape(s.value)) for s in Severity}
+_PII_HTML = {p: Markup(escape(p.value)) for p in PIIType}
+_MASK_HTML = {m: Markup(escape(m.value)) for m in MaskingType}
+
+# Installed as template globals rather than passed per render call; both
+# templates read the dataclasses directly, so the maps are the only
+# extra names they need
+for _tmpl in (_TEMPLATE, _FINDING_TEMPLATE):
+    _tmpl.globals.update(sev_html=_SEV_HTML, pii_html=_PII_HTML, mask_html=_MASK_HTML)
+
 
 def export_to_html(result: SuiteResult, output_path: str) -> None:
     """
@@ -271,10 +312,7 @@ def export_to_html(result: SuiteResult, output_path: str) -> None:
     output_file = Path(output_path)
     output_file.parent.mkdir(parents=True, exist_ok=True)
 
-    template = Template(HTML_TEMPLATE)
-
-    html_content = template.render(
-        suite_name=result.suite_name,
+    context = dict(
         timestamp=result.timestamp.strftime("%Y-%m-%d %H:%M:%S"),
         overall_passed=result.overall_passed,
         total_datasets=result.total_datasets,
@@ -282,31 +320,38 @@ def export_to_html(result: SuiteResult, output_path: str) -> None:
         passed_assertions=result.passed_assertions,
         failed_assertions=result.failed_assertions,
         execution_time_seconds=result.execution_time_seconds,
-        assertion_results=[
-            {
-                "assertion_type": ar.assertion_type,
-                "dataset": ar.dataset,
-                "passed": ar.passed,
-                "message": ar.message,
-                "severity": ar.severity.value,
-                "findings": [
-                    {
-                        "dataset": f.dataset,
-                        "column": f.column,
-                        "pii_type": f.pii_type.value,
-                        "masking_type": f.masking_type.value,
-                        "row_index": f.row_index,
-                        "redacted_sample": f.redacted_sample,
-                        "count": f.count,
-                        "severity": f.severity.value,
-                        "message": f.message,
-                    }
+        # The templates read the AssertionResult/Finding dataclasses
+        # directly, fusing serialization into rendering: no intermediate
+        # dict per record, and the lazy generator means only one
+        # assertion's fragment string is alive at a time while streaming
+        assertion_results=(
+            (
+                ar,
+                "".join(
+                    # Both conditions decided here as plain bools; the
+                    # fragment then truth-tests a name instead of
+                    # dispatching Jinja's `is not none` test per finding
+                    _FINDING_TEMPLATE.render(
+                        finding=f,
+                        has_sample=bool(f.redacted_sample),
+                        has_row=f.row_index is not None,
+                    )
                     for f in ar.findings
-                ],
-            }
+                ),
+            )
             for ar in result.assertion_results
-        ],
+        ),
     )
 
-    with open(output_file, "w") as f:
-        f.write(html_content)
+    # Stream straight to the file instead of materializing the whole
+    # document as one string first: peak memory stays flat no matter how
+    # many findings the report carries. Buffering batches the per-node
+    # writes Jinja's generator would otherwise issue one by one.
+    with output_file.open("w", encoding="utf-8", buffering=1 << 16) as f:
+        f.write(_HTML_HEAD_PRE)
+        f.write(escape(str(result.suite_name)))
+        f.write(_HTML_HEAD_POST)
+        stream = _TEMPLATE.stream(**context)
+        stream.enable_buffering(size=64)
+        stream.dump(f)
+        f.write(_HTML_TAIL)
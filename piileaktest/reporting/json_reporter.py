@@ -5,6 +5,11 @@ from pathlib import Path
 from datetime import datetime
 from piileaktest.models import SuiteResult, Finding, AssertionResult
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 
 def export_to_json(result: SuiteResult, output_path: str) -> None:
     """
@@ -20,6 +25,15 @@ def export_to_json(result: SuiteResult, output_path: str) -> None:
     # Convert to dict with proper serialization
     result_dict = _serialize_result(result)
 
+    if orjson is not None:
+        # One C-level walk over the dict, written as bytes in a single
+        # call; several times faster than the pure-Python encoder on
+        # reports with long finding lists
+        output_file.write_bytes(
+            orjson.dumps(result_dict, option=orjson.OPT_INDENT_2, default=str)
+        )
+        return
+
     with open(output_file, "w") as f:
         json.dump(result_dict, f, indent=2, default=str)
 
@@ -48,22 +62,25 @@ def _serialize_assertion_result(ar: AssertionResult) -> dict:
         "dataset": ar.dataset,
         "passed": ar.passed,
         "message": ar.message,
-        "severity": ar.severity.value,
+        "severity": ar.severity,
         "findings": [_serialize_finding(f) for f in ar.findings],
     }
 
 
 def _serialize_finding(finding: Finding) -> dict:
     """Serialize Finding to dictionary."""
+    # PIIType/MaskingType/Severity are str enums, so both orjson and the
+    # stdlib encoder emit their string values directly; skipping the
+    # three .value attribute walks saves work on every finding
     return {
         "dataset": finding.dataset,
         "column": finding.column,
-        "pii_type": finding.pii_type.value,
-        "masking_type": finding.masking_type.value,
+        "pii_type": finding.pii_type,
+        "masking_type": finding.masking_type,
         "row_index": finding.row_index,
         "redacted_sample": finding.redacted_sample,
         "count": finding.count,
-        "severity": finding.severity.value,
+        "severity": finding.severity,
         "message": finding.message,
     }
 
@@ -78,5 +95,10 @@ def load_from_json(input_path: str) -> dict:
     Returns:
         Dictionary representation of results
     """
+    if orjson is not None:
+        # Parse the raw bytes in one C call instead of decoding to a
+        # Python string first and walking it with the stdlib parser
+        return orjson.loads(Path(input_path).read_bytes())
+
     with open(input_path, "r") as f:
         return json.load(f)
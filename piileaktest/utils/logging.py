@@ -2,13 +2,31 @@
 
 import logging
 import sys
+from functools import lru_cache
 from typing import Optional
 
+# One formatter shared by every handler: the format never varies, so
+# there is no reason to rebuild it per setup_logger call
+_FORMATTER = logging.Formatter(
+    "%(asctime)s - %(name)s - %(levelname)s - %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
+)
 
+# Level names resolved once instead of a getattr per call
+_LEVELS = {
+    name: getattr(logging, name)
+    for name in ("DEBUG", "INFO", "WARN", "WARNING", "ERROR", "CRITICAL", "FATAL")
+}
+
+
+@lru_cache(maxsize=64)
 def setup_logger(name: str, level: str = "INFO") -> logging.Logger:
     """
     Setup a logger with consistent formatting.
 
+    Memoized per (name, level): repeat setup calls during CLI startup
+    return the configured logger without touching the logging module's
+    manager lock again.
+
     Args:
         name: Logger name
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
@@ -17,21 +35,22 @@ def setup_logger(name: str, level: str = "INFO") -> logging.Logger:
         Configured logger
     """
     logger = logging.getLogger(name)
-    logger.setLevel(getattr(logging, level.upper()))
+    logger.setLevel(_LEVELS[level.upper()])
 
     if not logger.handlers:
         handler = logging.StreamHandler(sys.stdout)
-        formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
-        )
-        handler.setFormatter(formatter)
+        handler.setFormatter(_FORMATTER)
         logger.addHandler(handler)
+        # The handler writes to stdout directly; stop records from also
+        # bubbling up to ancestor handlers and emitting twice
+        logger.propagate = False
 
     return logger
 
 
+@lru_cache(maxsize=256)
 def get_logger(name: Optional[str] = None) -> logging.Logger:
-    """Get or create a logger."""
+    """Get or create a logger (memoized: skips the manager lock on hits)."""
     if name is None:
         name = "piileaktest"
     return logging.getLogger(name)
@@ -1,6 +1,15 @@
 """Utility functions for redacting sensitive data in outputs."""
 
 import re
+from functools import lru_cache
+
+# Compiled once at import: the redactors run per finding sample, and a
+# module-level pattern skips the re-cache lookup every call pays
+_NON_DIGIT = re.compile(r"\D")
+
+# Preallocated mask run: slicing it is cheaper than building a fresh
+# "*" * n string per call, and 256 covers any realistic sample length
+_STARS = "*" * 256
 
 
 def redact_email(email: str) -> str:
@@ -9,16 +18,18 @@ def redact_email(email: str) -> str:
 
     Example: john.doe@example.com -> j***@e***.com
     """
-    if "@" not in email:
+    # Slice on find() offsets instead of split(): no temporary lists,
+    # and [:1] never raises on an empty local part or domain
+    at = email.find("@")
+    if at < 0:
         return mask_string(email)
 
-    local, domain = email.split("@", 1)
-    if "." in domain:
-        domain_parts = domain.split(".")
-        domain_name = domain_parts[0]
-        domain_ext = ".".join(domain_parts[1:])
-        return f"{local[0]}***@{domain_name[0]}***.{domain_ext}"
-    return f"{local[0]}***@{domain[0]}***"
+    local = email[:at]
+    domain = email[at + 1 :]
+    dot = domain.find(".")
+    if dot < 0:
+        return f"{local[:1]}***@{domain[:1]}***"
+    return f"{local[:1]}***@{domain[:1]}***.{domain[dot + 1:]}"
 
 
 def redact_ssn(ssn: str) -> str:
@@ -40,7 +51,7 @@ def redact_phone(phone: str) -> str:
     Example: (555) 123-4567 -> (***) ***-4567
     """
     # Extract digits
-    digits = re.sub(r"\D", "", phone)
+    digits = _NON_DIGIT.sub("", phone)
     if len(digits) >= 4:
         return f"(***) ***-{digits[-4:]}"
     return "***"
@@ -52,7 +63,7 @@ def redact_credit_card(card: str) -> str:
 
     Example: 4532123456789012 -> ****1234
     """
-    digits = re.sub(r"\D", "", card)
+    digits = _NON_DIGIT.sub("", card)
     if len(digits) >= 4:
         return "****" + digits[-4:]
     return "****"
@@ -70,8 +81,9 @@ def mask_string(s: str, keep_chars: int = 1) -> str:
         Masked string
     """
     if len(s) <= keep_chars:
-        return "*" * len(s)
-    return s[:keep_chars] + "*" * (len(s) - keep_chars)
+        return _STARS[: len(s)] if len(s) <= 256 else "*" * len(s)
+    n = len(s) - keep_chars
+    return s[:keep_chars] + (_STARS[:n] if n <= 256 else "*" * n)
 
 
 def redact_value(value: str, pii_type: str) -> str:
@@ -85,14 +97,24 @@ def redact_value(value: str, pii_type: str) -> str:
     Returns:
         Redacted value
     """
-    value_str = str(value)
+    return _redact_cached(str(value), pii_type)
 
-    redactors = {
-        "email": redact_email,
-        "ssn": redact_ssn,
-        "phone": redact_phone,
-        "credit_card": redact_credit_card,
-    }
 
-    redactor = redactors.get(pii_type.lower(), mask_string)
+@lru_cache(maxsize=8192)
+def _redact_cached(value_str: str, pii_type: str) -> str:
+    """Memoized redaction core (sample columns repeat values heavily)."""
+    # First probe with the key as given: callers pass the canonical
+    # lowercase PIIType values, so the common case skips the .lower()
+    # copy entirely
+    redactor = _REDACTORS.get(pii_type) or _REDACTORS.get(pii_type.lower(), mask_string)
     return redactor(value_str)
+
+
+# Dispatch table built once at import instead of per call; PII types
+# without a dedicated redactor fall back to mask_string
+_REDACTORS = {
+    "email": redact_email,
+    "ssn": redact_ssn,
+    "phone": redact_phone,
+    "credit_card": redact_credit_card,
+}
@@ -0,0 +1,42 @@
+"""Shared fixtures for the test suite.
+
+The assertion functions treat their input frames as read-only, so the
+common DataFrames are built once per session instead of once per test.
+"""
+
+import pandas as pd
+import pytest
+
+
+@pytest.fixture(scope="session")
+def df_customers_email():
+    """Customers frame with plaintext emails."""
+    return pd.DataFrame(
+        {
+            "customer_id": [1, 2, 3],
+            "email": ["john@example.com", "jane@example.com", "bob@example.com"],
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def df_customers_clean():
+    """Customers frame with no PII-bearing columns."""
+    return pd.DataFrame(
+        {
+            "customer_id": [1, 2, 3],
+            "name": ["John", "Jane", "Bob"],
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def df_email_and_ssn():
+    """Frame carrying two forbidden PII types at once."""
+    return pd.DataFrame(
+        {
+            "customer_id": [1, 2],
+            "email": ["john@example.com", "jane@example.com"],
+            "ssn": ["123-45-6789", "234-56-7890"],
+        }
+    )
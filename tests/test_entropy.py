@@ -1,10 +1,12 @@
 """Tests for entropy detector."""
 
+import pandas as pd
 import pytest
 from piileaktest.detectors.entropy import (
     calculate_shannon_entropy,
     is_high_entropy_token,
     detect_common_token_patterns,
+    token_shape_mask,
 )
 
 
@@ -47,3 +49,15 @@ class TestEntropyDetector:
         random_string = "just_a_normal_string"
         pattern = detect_common_token_patterns(random_string)
         assert pattern is None
+
+
+class TestTokenShapeMask:
+    def test_flags_only_token_shaped_values(self):
+        values = pd.Series(
+            [
+                "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9",
+                "short",
+                "has spaces so not a token 123456",
+            ]
+        )
+        assert list(token_shape_mask(values)) == [True, False, False]
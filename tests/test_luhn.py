@@ -1,7 +1,13 @@
 """Tests for Luhn credit card validator."""
 
+import pandas as pd
 import pytest
-from piileaktest.detectors.luhn import is_credit_card, detect_credit_card_masking
+from piileaktest.detectors.luhn import (
+    is_credit_card,
+    detect_credit_card_masking,
+    credit_card_mask,
+    credit_card_masking_vec,
+)
 from piileaktest.models import MaskingType
 
 
@@ -34,3 +40,35 @@ class TestLuhnValidator:
     def test_masking_detection_hash(self):
         masking = detect_credit_card_masking("5d41402abc4b2a76b9719d911017c592")
         assert masking == MaskingType.HASH
+
+
+class TestCreditCardMask:
+    def test_matches_scalar_validator(self):
+        values = [
+            "4532015112830366",
+            "4532 0151 1283 0366",
+            "4532-0151-1283-0366",
+            "1234567890123456",
+            "0000000000000000",
+            "not a card",
+            "123",
+        ]
+        mask = credit_card_mask(pd.Series(values))
+        assert list(mask) == [is_credit_card(v) for v in values]
+
+    def test_empty_series(self):
+        mask = credit_card_mask(pd.Series([], dtype=object))
+        assert not mask.any()
+
+
+class TestCreditCardMaskingVec:
+    def test_matches_scalar_classifier(self):
+        values = [
+            "4532015112830366",
+            "****0366",
+            "XXXX-XXXX-XXXX-0366",
+            "5d41402abc4b2a76b9719d911017c592",
+            "not a card",
+        ]
+        result = credit_card_masking_vec(pd.Series(values))
+        assert list(result) == [detect_credit_card_masking(v) for v in values]
@@ -7,85 +7,56 @@ from piileaktest.assertions import assert_no_forbidden_pii
 
 
 class TestNoPIIAssertion:
-    def test_forbidden_pii_detected(self):
+    def test_forbidden_pii_detected(self, df_customers_email):
         # Dataset with forbidden email
-        df = pd.DataFrame(
-            {
-                "customer_id": [1, 2, 3],
-                "email": ["john@example.com", "jane@example.com", "bob@example.com"],
-            }
-        )
-
         policy = DatasetPolicy(
             name="test_dataset",
             path="test.csv",
             forbidden_pii_types=[PIIType.EMAIL],
         )
 
-        result = assert_no_forbidden_pii(df, policy)
+        result = assert_no_forbidden_pii(df_customers_email, policy)
 
         assert not result.passed
         assert result.severity == Severity.CRITICAL
         assert len(result.findings) > 0
         assert result.findings[0].pii_type == PIIType.EMAIL
 
-    def test_no_forbidden_pii(self):
+    def test_no_forbidden_pii(self, df_customers_clean):
         # Dataset without forbidden PII
-        df = pd.DataFrame(
-            {
-                "customer_id": [1, 2, 3],
-                "name": ["John", "Jane", "Bob"],
-            }
-        )
-
         policy = DatasetPolicy(
             name="test_dataset",
             path="test.csv",
             forbidden_pii_types=[PIIType.EMAIL, PIIType.SSN],
         )
 
-        result = assert_no_forbidden_pii(df, policy)
+        result = assert_no_forbidden_pii(df_customers_clean, policy)
 
         assert result.passed
         assert result.severity == Severity.INFO
 
-    def test_multiple_pii_types_forbidden(self):
+    def test_multiple_pii_types_forbidden(self, df_email_and_ssn):
         # Dataset with multiple forbidden PII types
-        df = pd.DataFrame(
-            {
-                "customer_id": [1, 2],
-                "email": ["john@example.com", "jane@example.com"],
-                "ssn": ["123-45-6789", "234-56-7890"],
-            }
-        )
-
         policy = DatasetPolicy(
             name="test_dataset",
             path="test.csv",
             forbidden_pii_types=[PIIType.EMAIL, PIIType.SSN],
         )
 
-        result = assert_no_forbidden_pii(df, policy)
+        result = assert_no_forbidden_pii(df_email_and_ssn, policy)
 
         assert not result.passed
         assert len(result.findings) >= 2  # At least email and ssn findings
 
-    def test_empty_forbidden_list(self):
+    def test_empty_forbidden_list(self, df_customers_email):
         # No forbidden PII types specified
-        df = pd.DataFrame(
-            {
-                "customer_id": [1, 2],
-                "email": ["john@example.com", "jane@example.com"],
-            }
-        )
-
         policy = DatasetPolicy(
             name="test_dataset",
             path="test.csv",
             forbidden_pii_types=[],
         )
 
-        result = assert_no_forbidden_pii(df, policy)
+        result = assert_no_forbidden_pii(df_customers_email, policy)
 
         assert result.passed
         assert result.severity == Severity.INFO
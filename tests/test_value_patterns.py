@@ -1,5 +1,6 @@
 """Tests for value pattern detectors."""
 
+import pandas as pd
 import pytest
 from piileaktest.detectors.value_patterns import (
     EmailMatcher,
@@ -7,6 +8,7 @@ from piileaktest.detectors.value_patterns import (
     SSNMatcher,
     IPAddressMatcher,
     detect_pii_in_value,
+    detect_pii_in_column,
 )
 from piileaktest.models import MaskingType, PIIType
 
@@ -108,3 +110,18 @@ class TestDetectPIIInValue:
     def test_empty_string(self):
         results = detect_pii_in_value("")
         assert len(results) == 0
+
+
+class TestDetectPIIInColumn:
+    def test_matches_scalar_detector(self):
+        values = ["john@x.com", "555-123-4567", "plain text", "", "123-45-6789"]
+        series = pd.Series(values)
+        out = detect_pii_in_column(series)
+        for i, value in enumerate(values):
+            assert out.iloc[i] == tuple(detect_pii_in_value(value))
+
+    def test_handles_nulls_and_non_strings(self):
+        series = pd.Series(["x@y.com", None, 12345], index=["a", "b", "c"])
+        out = detect_pii_in_column(series)
+        assert list(out.index) == ["a", "b", "c"]
+        assert out.loc["b"] == ()